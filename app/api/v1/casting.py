@@ -15,7 +15,6 @@ from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Form
 from sqlalchemy import select
 
 from app.api.deps import DbSessionDep
-from app.core.settings import settings
 
 logger = logging.getLogger(__name__)
 from app.api.v1.schemas import (
@@ -42,7 +41,7 @@ from app.services.casting import (
     import_actor_from_local_file,
     save_actor_to_library,
 )
-from app.services.storage import LocalMediaStore
+from app.services.storage import default_media_store
 
 router = APIRouter(prefix="/casting", tags=["casting"])
 
@@ -244,10 +243,7 @@ async def import_actor_file(
 
     try:
         # Save file to media directory
-        store = LocalMediaStore(
-            root_dir=settings.media_root,
-            url_prefix=settings.media_url_prefix,
-        )
+        store = default_media_store()
         file_bytes = await file.read()
         mime_type = file.content_type or "application/octet-stream"
         
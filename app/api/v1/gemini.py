@@ -1,13 +1,12 @@
-import hashlib
-
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from app.api.deps import DbSessionDep
+from app.core.hashing import prompt_digest
 from app.core.settings import settings
 from app.services.vertex_gemini import GeminiClient
 from app.services.images import ImageService
-from app.services.storage import LocalMediaStore
+from app.services.storage import default_media_store
 
 
 router = APIRouter(tags=["gemini"])
@@ -55,10 +54,10 @@ def generate_image(payload: GenerateImageRequest, db=DbSessionDep):
 
     image_bytes, mime_type = gemini.generate_image(prompt=payload.prompt, model=payload.model)
 
-    store = LocalMediaStore(root_dir=settings.media_root, url_prefix=settings.media_url_prefix)
+    store = default_media_store()
     _, url = store.save_image_bytes(image_bytes=image_bytes, mime_type=mime_type)
 
-    prompt_hash = hashlib.sha256(payload.prompt.encode("utf-8")).hexdigest()
+    prompt_hash = prompt_digest(payload.prompt)
     image = ImageService(db).create_image(
         image_url=url,
         metadata={
@@ -30,7 +30,7 @@ def build_gemini_client() -> GeminiClient:
     if not settings.google_cloud_project and not settings.gemini_api_key:
         raise GeminiNotConfiguredError()
 
-    return GeminiClient(
+    client = GeminiClient(
         project=settings.google_cloud_project,
         location=settings.google_cloud_location,
         api_key=settings.gemini_api_key,
@@ -44,3 +44,10 @@ def build_gemini_client() -> GeminiClient:
         circuit_breaker_threshold=getattr(settings, "gemini_circuit_breaker_threshold", 5),
         circuit_breaker_timeout=getattr(settings, "gemini_circuit_breaker_timeout", 60),
     )
+
+    if settings.prompt_cache_enabled:
+        from app.services.prompt_cache import CachedGeminiClient
+
+        return CachedGeminiClient(client, max_entries=settings.prompt_cache_max_entries)
+
+    return client
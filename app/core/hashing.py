@@ -0,0 +1,34 @@
+"""Shared prompt digest helper.
+
+Several render-path nodes stamp artifacts and image metadata with the
+SHA-256 of the prompt they used. Hashing the same prompt repeatedly across
+retries and follow-up nodes is wasted work, so the digest is memoized on
+the prompt text (hashlib's OpenSSL backend already uses hardware SHA
+extensions where the CPU has them).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def prompt_digest(text: str) -> str:
+    """Hex SHA-256 of ``text``, cached across repeat calls."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def prompt_cache_key(prompt: str, model: str | None = None) -> str:
+    """Hex SHA-256 over ``model + NUL + prompt`` fed to the hash in parts.
+
+    Equivalent to hashing ``f"{model or ''}\\x00{prompt}"`` but skips the
+    concatenated copy of the (potentially tens-of-KB) prompt that the
+    f-string would allocate just to be hashed and thrown away.
+    """
+    h = hashlib.sha256()
+    if model:
+        h.update(model.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(prompt.encode("utf-8"))
+    return h.hexdigest()
@@ -0,0 +1,34 @@
+"""JSON encode/decode helpers backed by orjson when available.
+
+orjson is a C-extension encoder ~2-5x faster than stdlib `json` on the
+payload sizes the LLM stages move around; it is UTF-8 native, so the
+stdlib `ensure_ascii=False` behavior is its default. The stdlib fallback
+keeps the module importable when orjson is not installed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dep
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(text: str | bytes) -> Any:
+    """Parse JSON text; raises json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a compact (or 2-space-indented) UTF-8 JSON string."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
@@ -17,6 +17,13 @@ class Settings(BaseSettings):
 
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
 
+    # Collapse the three per-scene planning LLM calls (intent, plan, semantics)
+    # into a single combined-JSON Gemini round-trip.
+    combined_pipeline_enabled: bool = Field(
+        default=False,
+        validation_alias="COMBINED_PIPELINE_ENABLED",
+    )
+
     google_cloud_project: str | None = Field(default=None, validation_alias="GOOGLE_CLOUD_PROJECT")
     google_cloud_location: str = Field(default="us-central1", validation_alias="GOOGLE_CLOUD_LOCATION")
 
@@ -46,6 +53,16 @@ class Settings(BaseSettings):
         validation_alias="GEMINI_CIRCUIT_BREAKER_TIMEOUT",
     )
 
+    # Cache Gemini text generations keyed by prompt hash so retried or
+    # regenerated scenes with identical prompts skip the LLM round-trip.
+    prompt_cache_enabled: bool = Field(default=False, validation_alias="PROMPT_CACHE_ENABLED")
+    prompt_cache_max_entries: int = Field(default=256, validation_alias="PROMPT_CACHE_MAX_ENTRIES")
+
+    # Persist parsed LLM node outputs keyed by a hash of their prompt so
+    # re-runs and retries of deterministic nodes skip the Gemini call entirely.
+    llm_cache_enabled: bool = Field(default=False, validation_alias="LLM_CACHE_ENABLED")
+    llm_cache_ttl_seconds: int = Field(default=86400, validation_alias="LLM_CACHE_TTL_SECONDS")
+
     media_root: str = Field(default="./storage/media", validation_alias="MEDIA_ROOT")
     media_url_prefix: str = Field(default="/media", validation_alias="MEDIA_URL_PREFIX")
     log_file: str | None = Field(default=None, validation_alias="LOG_FILE")
@@ -0,0 +1,52 @@
+"""right-size over-wide varchar columns
+
+Revision ID: 20260828_0001
+Revises: 83f5330535c1
+Create Date: 2026-08-28
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20260828_0001"
+down_revision = "83f5330535c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # String(255) was a legacy default; realistic maxima are far smaller.
+    # Narrower columns shrink sort/hash buffers on ORDER BY / GROUP BY.
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.alter_column("name", type_=sa.String(length=128), existing_nullable=False)
+
+    with op.batch_alter_table("stories", schema=None) as batch_op:
+        batch_op.alter_column("title", type_=sa.String(length=128), existing_nullable=False)
+
+    with op.batch_alter_table("characters", schema=None) as batch_op:
+        batch_op.alter_column("name", type_=sa.String(length=128), existing_nullable=False)
+
+    with op.batch_alter_table("episodes", schema=None) as batch_op:
+        batch_op.alter_column("title", type_=sa.String(length=128), existing_nullable=False)
+
+    with op.batch_alter_table("artifacts", schema=None) as batch_op:
+        batch_op.alter_column("type", type_=sa.String(length=32), existing_nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("artifacts", schema=None) as batch_op:
+        batch_op.alter_column("type", type_=sa.String(length=64), existing_nullable=False)
+
+    with op.batch_alter_table("episodes", schema=None) as batch_op:
+        batch_op.alter_column("title", type_=sa.String(length=255), existing_nullable=False)
+
+    with op.batch_alter_table("characters", schema=None) as batch_op:
+        batch_op.alter_column("name", type_=sa.String(length=255), existing_nullable=False)
+
+    with op.batch_alter_table("stories", schema=None) as batch_op:
+        batch_op.alter_column("title", type_=sa.String(length=255), existing_nullable=False)
+
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.alter_column("name", type_=sa.String(length=255), existing_nullable=False)
@@ -0,0 +1,23 @@
+"""index artifacts.parent_id for version-chain traversal
+
+Revision ID: 20260828_0002
+Revises: 20260828_0001
+Create Date: 2026-08-28
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260828_0002"
+down_revision = "20260828_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_artifacts_parent_id", "artifacts", ["parent_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_parent_id", table_name="artifacts")
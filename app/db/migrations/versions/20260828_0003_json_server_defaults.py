@@ -0,0 +1,53 @@
+"""move empty JSON defaults to the server side
+
+Revision ID: 20260828_0003
+Revises: 20260828_0002
+Create Date: 2026-08-28
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20260828_0003"
+down_revision = "20260828_0002"
+branch_labels = None
+depends_on = None
+
+_EMPTY_OBJECT = sa.text("'{}'")
+_EMPTY_ARRAY = sa.text("'[]'")
+
+
+def upgrade() -> None:
+    # Empty-object defaults now come from the DB, so inserts that omit the
+    # column skip the Python factory + JSON serialization entirely.
+    with op.batch_alter_table("character_reference_images", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=_EMPTY_OBJECT, existing_nullable=False)
+    with op.batch_alter_table("images", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=_EMPTY_OBJECT, existing_nullable=False)
+    with op.batch_alter_table("exports", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=_EMPTY_OBJECT, existing_nullable=False)
+    with op.batch_alter_table("dialogue_layers", schema=None) as batch_op:
+        batch_op.alter_column("bubbles", server_default=_EMPTY_ARRAY, existing_nullable=False)
+    with op.batch_alter_table("layers", schema=None) as batch_op:
+        batch_op.alter_column("objects", server_default=_EMPTY_ARRAY, existing_nullable=False)
+    with op.batch_alter_table("environment_anchors", schema=None) as batch_op:
+        batch_op.alter_column("reference_images", server_default=_EMPTY_ARRAY, existing_nullable=False)
+        batch_op.alter_column("locked_elements", server_default=_EMPTY_ARRAY, existing_nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("environment_anchors", schema=None) as batch_op:
+        batch_op.alter_column("locked_elements", server_default=None, existing_nullable=False)
+        batch_op.alter_column("reference_images", server_default=None, existing_nullable=False)
+    with op.batch_alter_table("layers", schema=None) as batch_op:
+        batch_op.alter_column("objects", server_default=None, existing_nullable=False)
+    with op.batch_alter_table("dialogue_layers", schema=None) as batch_op:
+        batch_op.alter_column("bubbles", server_default=None, existing_nullable=False)
+    with op.batch_alter_table("exports", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=None, existing_nullable=False)
+    with op.batch_alter_table("images", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=None, existing_nullable=False)
+    with op.batch_alter_table("character_reference_images", schema=None) as batch_op:
+        batch_op.alter_column("metadata", server_default=None, existing_nullable=False)
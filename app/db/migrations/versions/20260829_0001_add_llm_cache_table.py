@@ -0,0 +1,36 @@
+"""Add llm_cache table for content-addressed LLM node caching
+
+Revision ID: 20260829_0001
+Revises: 20260828_0003
+Create Date: 2026-08-29
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260829_0001"
+down_revision = "20260828_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache",
+        sa.Column("cache_id", sa.Uuid(), nullable=False),
+        sa.Column("scene_id", sa.Uuid(), nullable=True),
+        sa.Column("node_name", sa.String(length=64), nullable=False),
+        sa.Column("input_hash", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["scene_id"], ["scenes.scene_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cache_id"),
+        sa.UniqueConstraint("node_name", "input_hash", name="uq_llm_cache_node_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("llm_cache")
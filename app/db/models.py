@@ -1,41 +1,63 @@
 from __future__ import annotations
 
+import json
 import uuid
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import Uuid
 
 from app.db.base import Base
 
 
-class Project(Base):
+class CreatedAtMixin:
+    """Server-side ``created_at`` default shared by every timestamped model."""
+
+    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class TimestampMixin(CreatedAtMixin):
+    """``created_at`` plus a DB-maintained ``updated_at`` column."""
+
+    updated_at: Mapped[object] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+
+class Project(CreatedAtMixin, Base):
     __tablename__ = "projects"
 
     project_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
 
     stories: Mapped[list["Story"]] = relationship(back_populates="project", cascade="all, delete-orphan")
 
 
-class Story(Base):
+class Story(TimestampMixin, Base):
     __tablename__ = "stories"
 
     story_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=False
     )
-    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    title: Mapped[str] = mapped_column(String(128), nullable=False)
     default_image_style: Mapped[str] = mapped_column(String(64), nullable=False, default="default")
     generation_status: Mapped[str] = mapped_column(String(32), nullable=False, default="idle")
     generation_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     progress: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     progress_updated_at: Mapped[object | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    updated_at: Mapped[object] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
-    )
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
     created_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
     updated_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
@@ -54,7 +76,7 @@ class Story(Base):
     )
 
 
-class Scene(Base):
+class Scene(TimestampMixin, Base):
     __tablename__ = "scenes"
 
     scene_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -71,10 +93,6 @@ class Scene(Base):
     selected_render_artifact_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("artifacts.artifact_id", ondelete="SET NULL"), nullable=True
     )
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[object] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
-    )
     created_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
     updated_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
@@ -82,7 +100,7 @@ class Scene(Base):
     artifacts: Mapped[list["Artifact"]] = relationship(back_populates="scene", cascade="all, delete-orphan")
 
 
-class Character(Base):
+class Character(CreatedAtMixin, Base):
     __tablename__ = "characters"
 
     character_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -91,7 +109,7 @@ class Character(Base):
         ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=True
     )
     canonical_code: Mapped[str | None] = mapped_column(String(16), nullable=True)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     role: Mapped[str] = mapped_column(String(32), nullable=False, default="secondary")
     gender: Mapped[str | None] = mapped_column(String(16), nullable=True)
@@ -106,7 +124,6 @@ class Character(Base):
     default_image_style_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
     is_library_saved: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     approved: Mapped[bool] = mapped_column(nullable=False, default=False)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     project: Mapped[Project | None] = relationship()
     story_links: Mapped[list["StoryCharacter"]] = relationship(
@@ -125,7 +142,7 @@ class Character(Base):
     )
 
 
-class StoryCharacter(Base):
+class StoryCharacter(CreatedAtMixin, Base):
     __tablename__ = "story_characters"
 
     story_id: Mapped[uuid.UUID] = mapped_column(
@@ -135,13 +152,12 @@ class StoryCharacter(Base):
         ForeignKey("characters.character_id", ondelete="CASCADE"), primary_key=True
     )
     narrative_description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     story: Mapped[Story] = relationship(back_populates="character_links")
     character: Mapped[Character] = relationship(back_populates="story_links")
 
 
-class CharacterReferenceImage(Base):
+class CharacterReferenceImage(CreatedAtMixin, Base):
     __tablename__ = "character_reference_images"
 
     reference_image_id: Mapped[uuid.UUID] = mapped_column(
@@ -154,13 +170,12 @@ class CharacterReferenceImage(Base):
     ref_type: Mapped[str] = mapped_column(String(32), nullable=False, default="face")
     approved: Mapped[bool] = mapped_column(nullable=False, default=False)
     is_primary: Mapped[bool] = mapped_column(nullable=False, default=False)
-    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, default=dict)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, server_default=text("'{}'"))
 
     character: Mapped[Character] = relationship(back_populates="reference_images")
 
 
-class CharacterVariant(Base):
+class CharacterVariant(CreatedAtMixin, Base):
     """Character variant representing a specific look/style.
 
     Variants can be:
@@ -189,14 +204,13 @@ class CharacterVariant(Base):
     generated_image_ids: Mapped[list] = mapped_column(JSON, nullable=False, default=list)  # List of Image UUIDs
     is_default: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     is_active_for_story: Mapped[bool] = mapped_column(nullable=False, default=False)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     character: Mapped[Character] = relationship(back_populates="variants")
     story: Mapped[Story | None] = relationship(back_populates="character_variants")
     reference_image: Mapped[CharacterReferenceImage | None] = relationship()
 
 
-class CharacterVariantSuggestion(Base):
+class CharacterVariantSuggestion(CreatedAtMixin, Base):
     __tablename__ = "character_variant_suggestions"
 
     suggestion_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -208,26 +222,26 @@ class CharacterVariantSuggestion(Base):
     )
     variant_type: Mapped[str] = mapped_column(String(32), nullable=False, default="outfit_change")
     override_attributes: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     character: Mapped[Character] = relationship()
     story: Mapped[Story] = relationship()
 
 
-class Artifact(Base):
+class Artifact(CreatedAtMixin, Base):
     __tablename__ = "artifacts"
+    # High-volume write table: skip INSERT .. RETURNING for server defaults.
+    __table_args__ = {"implicit_returning": False}
 
     artifact_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     scene_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("scenes.scene_id", ondelete="CASCADE"), nullable=False
     )
-    type: Mapped[str] = mapped_column(String(64), nullable=False)
+    type: Mapped[str] = mapped_column(String(32), nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     parent_id: Mapped[uuid.UUID | None] = mapped_column(
-        ForeignKey("artifacts.artifact_id", ondelete="SET NULL"), nullable=True
+        ForeignKey("artifacts.artifact_id", ondelete="SET NULL"), nullable=True, index=True
     )
     payload: Mapped[dict] = mapped_column(JSON, nullable=False)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
     created_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
     updated_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
@@ -236,19 +250,51 @@ class Artifact(Base):
         "Artifact",
         foreign_keys=[parent_id],
         remote_side="Artifact.artifact_id",
+        lazy="joined",
+        join_depth=1,
     )
 
+    @property
+    def payload_json(self) -> str:
+        """Pretty-printed JSON of ``payload``, serialized once per instance.
+
+        Planning nodes embed artifact payloads into several prompts; caching
+        the string here avoids re-walking the same dict for every prompt.
+        """
+        cached = self.__dict__.get("_payload_json")
+        if cached is None:
+            cached = json.dumps(self.payload, ensure_ascii=False, indent=2)
+            self.__dict__["_payload_json"] = cached
+        return cached
 
-class Image(Base):
+
+class LLMCacheEntry(CreatedAtMixin, Base):
+    __tablename__ = "llm_cache"
+    __table_args__ = (
+        UniqueConstraint("node_name", "input_hash", name="uq_llm_cache_node_hash"),
+        {"implicit_returning": False},
+    )
+
+    cache_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    scene_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("scenes.scene_id", ondelete="CASCADE"), nullable=True
+    )
+    node_name: Mapped[str] = mapped_column(String(64), nullable=False)
+    input_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    expires_at: Mapped[object | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class Image(CreatedAtMixin, Base):
     __tablename__ = "images"
+    __table_args__ = {"implicit_returning": False}
 
     image_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     artifact_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("artifacts.artifact_id", ondelete="SET NULL"), nullable=True
     )
     image_url: Mapped[str] = mapped_column(Text, nullable=False)
-    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, default=dict)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, server_default=text("'{}'"))
 
 
 class AuditLog(Base):
@@ -264,31 +310,30 @@ class AuditLog(Base):
     new_value: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
 
-class DialogueLayer(Base):
+class DialogueLayer(CreatedAtMixin, Base):
     __tablename__ = "dialogue_layers"
+    __table_args__ = {"implicit_returning": False}
 
     dialogue_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     scene_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("scenes.scene_id", ondelete="CASCADE"), nullable=False, unique=True
     )
-    bubbles: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    bubbles: Mapped[list[dict]] = mapped_column(JSON, nullable=False, server_default=text("'[]'"))
 
 
-class EnvironmentAnchor(Base):
+class EnvironmentAnchor(CreatedAtMixin, Base):
     __tablename__ = "environment_anchors"
 
     environment_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     usage_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     anchor_type: Mapped[str] = mapped_column(String(32), nullable=False, default="descriptive")
-    reference_images: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
-    locked_elements: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
+    reference_images: Mapped[list[dict]] = mapped_column(JSON, nullable=False, server_default=text("'[]'"))
+    locked_elements: Mapped[list[dict]] = mapped_column(JSON, nullable=False, server_default=text("'[]'"))
     pinned: Mapped[bool] = mapped_column(nullable=False, default=False)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
-class ExportJob(Base):
+class ExportJob(CreatedAtMixin, Base):
     __tablename__ = "exports"
 
     export_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -300,21 +345,19 @@ class ExportJob(Base):
     )
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="queued")
     output_url: Mapped[str | None] = mapped_column(Text, nullable=True)
-    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, default=dict)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, server_default=text("'{}'"))
 
 
-class Episode(Base):
+class Episode(CreatedAtMixin, Base):
     __tablename__ = "episodes"
 
     episode_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     story_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("stories.story_id", ondelete="CASCADE"), nullable=False
     )
-    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    title: Mapped[str] = mapped_column(String(128), nullable=False)
     default_image_style: Mapped[str] = mapped_column(String(64), nullable=False, default="default")
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="draft")
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class EpisodeScene(Base):
@@ -341,19 +384,19 @@ class EpisodeAsset(Base):
     asset_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
 
 
-class Layer(Base):
+class Layer(CreatedAtMixin, Base):
     __tablename__ = "layers"
+    __table_args__ = {"implicit_returning": False}
 
     layer_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     scene_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("scenes.scene_id", ondelete="CASCADE"), nullable=False
     )
     layer_type: Mapped[str] = mapped_column(String(32), nullable=False)
-    objects: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    objects: Mapped[list[dict]] = mapped_column(JSON, nullable=False, server_default=text("'[]'"))
 
 
-class StylePreset(Base):
+class StylePreset(TimestampMixin, Base):
     """Custom style presets for story/image generation.
 
     Style presets can be global (system-provided) or project-specific (user-created).
@@ -376,7 +419,3 @@ class StylePreset(Base):
     style_config: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     is_system: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
-    created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[object] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
@@ -1,17 +1,40 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.core.jsonio import json_dumps, json_loads
+
 
 _engine = None
 _SessionLocal = None
 
+_async_engine = None
+_AsyncSessionLocal = None
+
 
 def init_engine(database_url: str) -> None:
     global _engine, _SessionLocal
-    _engine = create_engine(database_url, pool_pre_ping=True)
+    # pool_pre_ping costs a SELECT 1 round trip on every checkout; recycle
+    # connections before the server's idle timeout and invalidate on
+    # disconnect errors instead, so the common path skips the ping.
+    # Artifact payloads are large nested JSON; route column (de)serialization
+    # through the orjson-backed helpers instead of stdlib json.
+    _engine = create_engine(
+        database_url,
+        pool_pre_ping=False,
+        pool_recycle=600,
+        json_serializer=json_dumps,
+        json_deserializer=json_loads,
+    )
+
+    @event.listens_for(_engine, "handle_error")
+    def _invalidate_on_disconnect(ctx):
+        if ctx.is_disconnect and ctx.connection is not None:
+            ctx.connection.invalidate()
+
     _SessionLocal = sessionmaker(
         bind=_engine,
         autoflush=False,
@@ -21,6 +44,28 @@ def init_engine(database_url: str) -> None:
     )
 
 
+def init_async_engine(database_url: str) -> None:
+    """Build the async engine/sessionmaker (postgresql+asyncpg URLs).
+
+    Unlike the sync engine, async sessions yield back to the event loop on
+    every await, so DB calls no longer occupy threadpool workers.
+    """
+    global _async_engine, _AsyncSessionLocal
+    _async_engine = create_async_engine(
+        database_url,
+        pool_size=20,
+        max_overflow=30,
+        pool_use_lifo=True,
+        json_serializer=json_dumps,
+        json_deserializer=json_loads,
+    )
+    _AsyncSessionLocal = async_sessionmaker(
+        bind=_async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
 def get_engine():
     if _engine is None:
         raise RuntimeError("Database engine is not initialized")
@@ -34,18 +79,47 @@ def get_sessionmaker():
 
 
 def get_db() -> Generator[Session, None, None]:
-    SessionLocal = get_sessionmaker()
-    db = SessionLocal()
+    # Hot path: read the global once instead of going through get_sessionmaker()
+    # so each request pays a single lookup rather than a call + None check.
+    new_session = _SessionLocal
+    if new_session is None:
+        raise RuntimeError("Database sessionmaker is not initialized")
+    db = new_session()
     try:
         yield db
     finally:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    new_session = _AsyncSessionLocal
+    if new_session is None:
+        raise RuntimeError("Async database sessionmaker is not initialized")
+    db = new_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def bulk_insert_no_return(db: Session, model, rows: list[dict]) -> None:
+    """Insert many rows via Core without per-row RETURNING.
+
+    Intended for models with ``implicit_returning`` disabled (Artifact, Image,
+    Layer, DialogueLayer); if server-computed columns are needed afterwards,
+    fetch them with a single follow-up SELECT.
+    """
+    if not rows:
+        return
+    db.execute(insert(model), rows)
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
-    SessionLocal = get_sessionmaker()
-    db = SessionLocal()
+    new_session = _SessionLocal
+    if new_session is None:
+        raise RuntimeError("Database sessionmaker is not initialized")
+    db = new_session()
     try:
         yield db
     finally:
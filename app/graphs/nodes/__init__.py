@@ -10,9 +10,11 @@ from app.graphs.nodes.planning import (
     normalize_character_profiles_llm,
     run_art_director,
     run_blind_test_evaluator,
+    run_combined_scene_planner,
     run_dialogue_extractor,
     run_layout_template_resolver,
     run_panel_plan_generator,
+    run_panel_plan_generator_batch,
     run_panel_plan_normalizer,
     run_panel_semantic_filler,
     run_qc_checker,
@@ -100,7 +102,9 @@ __all__ = [
     "run_image_renderer",
     "run_layout_template_resolver",
     "run_panel_plan_generator",
+    "run_panel_plan_generator_batch",
     "run_panel_plan_normalizer",
+    "run_combined_scene_planner",
     "run_panel_semantic_filler",
     "run_prompt_compiler",
     "run_qc_checker",
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from app.prompts.loader import get_prompt
 
 ARTIFACT_SCENE_INTENT = "scene_intent"
@@ -49,7 +51,9 @@ PACING_OPTIONS = frozenset([
     "impact",
 ])
 
-GENRE_PROFILES = {
+# Read-only genre lookup table; MappingProxyType guards against accidental
+# in-place mutation by callers sharing the module-level instance.
+GENRE_PROFILES = MappingProxyType({
     "action": {
         "panel_count_range": (60, 70),
         "required_shot_types": ["action", "reaction"],
@@ -75,4 +79,4 @@ GENRE_PROFILES = {
         "required_shot_types": ["reaction"],
         "forbidden_transitions": ["aspect_to_aspect"]
     }
-}
+})
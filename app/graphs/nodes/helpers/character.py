@@ -1,5 +1,6 @@
 import re
 import uuid
+from functools import lru_cache
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -53,44 +54,93 @@ def _active_variant_reference_images(
     db: Session,
     story_id: uuid.UUID,
 ) -> dict[tuple[uuid.UUID, str], CharacterReferenceImage]:
-    """Get mapping of (character_id, variant_type) to reference image."""
-    variants = list(_active_variants_by_character(db, story_id).values())
-    if not variants:
-        return {}
+    """Get mapping of (character_id, variant_type) to reference image.
 
-    variant_ids = {variant.reference_image_id for variant in variants if variant.reference_image_id}
-    if not variant_ids:
-        return {}
-
-    refs = list(
-        db.execute(
-            select(CharacterReferenceImage).where(CharacterReferenceImage.reference_image_id.in_(variant_ids))
+    Single JOIN instead of fetching active variants and their reference
+    images in two sequential queries.
+    """
+    rows = db.execute(
+        select(
+            CharacterVariant.character_id,
+            CharacterVariant.variant_type,
+            CharacterReferenceImage,
+        )
+        .join(
+            CharacterReferenceImage,
+            CharacterReferenceImage.reference_image_id == CharacterVariant.reference_image_id,
+        )
+        .where(
+            CharacterVariant.story_id == story_id,
+            CharacterVariant.is_active_for_story.is_(True),
         )
-        .scalars()
-        .all()
     )
-    ref_lookup = {ref.reference_image_id: ref for ref in refs}
-    results: dict[tuple[uuid.UUID, str], CharacterReferenceImage] = {}
-    for variant in variants:
-        ref = ref_lookup.get(variant.reference_image_id)
-        if ref is None:
-            continue
-        results[(variant.character_id, variant.variant_type.lower())] = ref
-    return results
+    return {
+        (character_id, variant_type.lower()): ref
+        for character_id, variant_type, ref in rows
+    }
 
 
-def _character_codes(characters: list[Character]) -> dict[uuid.UUID, str]:
-    def _code_from_index(index: int) -> str:
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        result = ""
-        while True:
-            index, rem = divmod(index, 26)
-            result = alphabet[rem] + result
-            if index == 0:
-                break
-            index -= 1
-        return f"CHAR_{result}"
+_FORBIDDEN_TERMS = (
+    "hair",
+    "hairstyle",
+    "bangs",
+    "eyes",
+    "eye",
+    "jawline",
+    "cheekbones",
+    "face",
+    "facial",
+    "height",
+    "tall",
+    "short",
+    "slender",
+    "muscular",
+    "curvy",
+    "build",
+    "physique",
+    "proportions",
+    "handsome",
+    "beautiful",
+    "pretty",
+    "attractive",
+)
+
+# Compiled once at import: these run per panel x per character inside
+# _inject_character_identities, and per-call re.compile churns Python's
+# global pattern cache. The alternation also turns the per-term sub loop
+# into one scan of the text.
+_MEASURE_RE = re.compile(r"\b\d{2,3}\s?cm\b|\b\d\.\d\s?m\b|\b\d'\d{1,2}\"?\b", re.IGNORECASE)
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(term) for term in _FORBIDDEN_TERMS) + r")\b",
+    re.IGNORECASE,
+)
+_DOUBLE_SPACE_RE = re.compile(r"\s{2,}")
 
+
+def _strip_forbidden_descriptors(text: str) -> str:
+    cleaned = _MEASURE_RE.sub("", text)
+    cleaned = _FORBIDDEN_RE.sub("", cleaned)
+    return _DOUBLE_SPACE_RE.sub(" ", cleaned).strip()
+
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@lru_cache(maxsize=1024)
+def _code_from_index(index: int) -> str:
+    # Collect digits in a list and join once; prepending to a str re-copies
+    # the accumulated prefix on every round.
+    chars: list[str] = []
+    while True:
+        index, rem = divmod(index, 26)
+        chars.append(_ALPHABET[rem])
+        if index == 0:
+            break
+        index -= 1
+    return "CHAR_" + "".join(reversed(chars))
+
+
+def _character_codes(characters: list[Character]) -> dict[uuid.UUID, str]:
     codes: dict[uuid.UUID, str] = {}
     used = {c.canonical_code for c in characters if c.canonical_code}
     idx = 0
@@ -114,11 +164,15 @@ def _inject_character_identities(
     reference_char_ids: set[uuid.UUID],
     variants_by_character: dict[tuple[uuid.UUID, str], CharacterVariant] | dict[uuid.UUID, CharacterVariant] | None = None,
     style_id: str | None = None,
+    codes: dict[uuid.UUID, str] | None = None,
 ) -> dict:
     if not panel_semantics or not characters:
         return panel_semantics
 
-    codes = _character_codes(characters)
+    # Callers that also build the character layer pass the codes in so the
+    # assignment runs once per compile instead of once per consumer.
+    if codes is None:
+        codes = _character_codes(characters)
     name_map: dict[str, dict[str, str]] = {}
     variants_by_character = variants_by_character or {}
     
@@ -170,61 +224,41 @@ def _inject_character_identities(
             if c.hair_description:
                 parts.append(f"hair: {c.hair_description}")
             label = ", ".join(parts)
-        name_map[c.name.lower()] = {"label": label, "code": base, "dialogue_label": dialogue_label}
-
-    forbidden_terms = [
-        "hair",
-        "hairstyle",
-        "bangs",
-        "eyes",
-        "eye",
-        "jawline",
-        "cheekbones",
-        "face",
-        "facial",
-        "height",
-        "tall",
-        "short",
-        "slender",
-        "muscular",
-        "curvy",
-        "build",
-        "physique",
-        "proportions",
-        "handsome",
-        "beautiful",
-        "pretty",
-        "attractive",
-    ]
-
-    def _strip_forbidden_descriptors(text: str) -> str:
-        cleaned = text
-        cleaned = re.sub(r"\b\d{2,3}\s?cm\b", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\b\d\.\d\s?m\b", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\b\d'\d{1,2}\"?\b", "", cleaned)
-        for term in forbidden_terms:
-            cleaned = re.sub(rf"\b{re.escape(term)}\b", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
-        return cleaned
+        name_map[c.name.lower()] = {
+            "label": label,
+            "code": base,
+            "dialogue_label": dialogue_label,
+            "is_reference": c.character_id in reference_char_ids,
+        }
+
+    # One alternation over all names, compiled once per injection call;
+    # _replace_text then scans each text exactly once instead of once per
+    # character. Longest-first ordering keeps full names from being
+    # shadowed by shorter prefixes.
+    names_re = re.compile(
+        r"\b(" + "|".join(re.escape(n) for n in sorted(name_map, key=len, reverse=True)) + r")('s)?\b",
+        re.IGNORECASE,
+    )
 
     def _replace_text(text: str, label_key: str = "label") -> str:
         if not text:
             return text
-        updated = text
+        # Cheap substring prefilter: scenery panels rarely mention anyone,
+        # and str.__contains__ is far cheaper than the alternation scan.
+        lowered = text.lower()
+        if not any(name in lowered for name in name_map):
+            return text
         matched_reference = False
-        for name, payload in name_map.items():
-            pattern = re.compile(rf"\b({re.escape(name)})('s)?\b", re.IGNORECASE)
-            if pattern.search(updated):
-                for c in characters:
-                    if c.name and c.name.lower() == name and c.character_id in reference_char_ids:
-                        matched_reference = True
-                        break
-
-            def _repl(match: re.Match) -> str:
-                suffix = match.group(2) or ""
-                return f"{payload[label_key]}{suffix}"
-
-            updated = pattern.sub(_repl, updated)
+
+        def _repl(match: re.Match) -> str:
+            nonlocal matched_reference
+            payload = name_map[match.group(1).lower()]
+            if payload["is_reference"]:
+                matched_reference = True
+            suffix = match.group(2) or ""
+            return f"{payload[label_key]}{suffix}"
+
+        updated = names_re.sub(_repl, text)
         if matched_reference:
             updated = _strip_forbidden_descriptors(updated)
         return updated
@@ -1,5 +1,7 @@
 import re
 
+_QUOTE_RE = re.compile(r'“([^”]+)”|"([^"]+)"')
+
 _NARRATION_LIKE_PHRASES = (
     " he says",
     " she says",
@@ -20,6 +22,10 @@ _NARRATION_LIKE_PHRASES = (
     "meanwhile",
 )
 
+# One alternation pass per line instead of 14+ substring probes; escaped
+# literals keep the plain-substring semantics of the phrase tuple.
+_NARRATION_LIKE_RE = re.compile("|".join(re.escape(p) for p in _NARRATION_LIKE_PHRASES))
+
 _GENERIC_DIALOGUE_PATTERNS = (
     "as you know",
     "let me explain",
@@ -32,12 +38,15 @@ _GENERIC_DIALOGUE_PATTERNS = (
 
 
 def _extract_dialogue_lines(text: str) -> list[str]:
-    lines = []
-    for match in re.findall(r"“([^”]+)”", text):
-        lines.append(match.strip())
-    for match in re.findall(r"\"([^\"]+)\"", text):
-        line = match.strip()
-        if line and line not in lines:
+    # One alternation pass over the text instead of separate smart-quote and
+    # ascii-quote scans; the set guard replaces the linear `not in lines`
+    # membership check per ascii match.
+    seen: set[str] = set()
+    lines: list[str] = []
+    for match in _QUOTE_RE.finditer(text):
+        line = (match.group(1) or match.group(2) or "").strip()
+        if line and line not in seen:
+            seen.add(line)
             lines.append(line)
     return lines
 
@@ -69,8 +78,7 @@ def _normalize_dialogue_script(raw: dict | None, panel_ids: list[int]) -> dict:
     result_panels = []
 
     def _is_narration_like(text: str) -> bool:
-        lowered = text.lower()
-        return any(phrase in lowered for phrase in _NARRATION_LIKE_PHRASES)
+        return _NARRATION_LIKE_RE.search(text.lower()) is not None
 
     def _is_generic_dialogue(text: str) -> bool:
         lowered = text.lower()
@@ -0,0 +1,11 @@
+"""Re-export of the orjson-backed JSON helpers from :mod:`app.core.jsonio`.
+
+The implementation lives in app.core so low-level modules (e.g. the DB
+engine's column codecs) can use it without importing the graph package.
+"""
+
+from __future__ import annotations
+
+from app.core.jsonio import json_dumps, json_loads, orjson
+
+__all__ = ["json_dumps", "json_loads", "orjson"]
@@ -1,10 +1,52 @@
 import math
+from dataclasses import dataclass
 
 from app.graphs.nodes.constants import VALID_GRAMMAR_IDS
 from app.graphs.nodes.helpers.scene import _choose_mid_grammar
 
 
+@dataclass(slots=True)
+class PanelRecord:
+    """Slot-backed view of a panel dict for hot normalization/QC loops.
+
+    Attribute reads hit fixed slot offsets instead of repeated dict lookups;
+    the original dict is kept in ``extras`` so unknown keys survive the
+    round-trip back to payload form.
+    """
+
+    grammar_id: str | None
+    story_function: str | None
+    width_percentage: object
+    extras: dict
+
+
+def _panel_record(panel: dict) -> PanelRecord:
+    hierarchy = panel.get("panel_hierarchy")
+    return PanelRecord(
+        grammar_id=panel.get("grammar_id"),
+        story_function=panel.get("story_function"),
+        width_percentage=hierarchy.get("width_percentage") if isinstance(hierarchy, dict) else None,
+        extras=panel,
+    )
+
+
+def _to_panel_records(panels: list[dict]) -> list[PanelRecord]:
+    # List comprehensions size the result in one allocation instead of
+    # append-driven growth steps.
+    return [_panel_record(panel) for panel in panels]
+
+
+def _records_to_panels(records: list[PanelRecord]) -> list[dict]:
+    return [
+        {**rec.extras, "grammar_id": rec.grammar_id, "story_function": rec.story_function}
+        for rec in records
+    ]
+
+
 def _heuristic_panel_plan(scene_text: str, panel_count: int) -> dict:
+    # _choose_mid_grammar is pure in scene_text; compute it once instead of
+    # re-scanning the text for every middle panel.
+    mid_grammar = _choose_mid_grammar(scene_text) if panel_count > 2 else None
     panels: list[dict] = []
     for idx in range(panel_count):
         if idx == 0:
@@ -12,7 +54,7 @@ def _heuristic_panel_plan(scene_text: str, panel_count: int) -> dict:
         elif idx == panel_count - 1:
             grammar_id = "reaction"
         else:
-            grammar_id = _choose_mid_grammar(scene_text)
+            grammar_id = mid_grammar
         panels.append(
             {
                 "panel_index": idx + 1,
@@ -23,18 +65,31 @@ def _heuristic_panel_plan(scene_text: str, panel_count: int) -> dict:
     return {"panels": panels}
 
 
+_GRAMMAR_STORY_FUNCTION_MAP = {
+    "establishing": "setup",
+    "dialogue_medium": "dialogue",
+    "emotion_closeup": "emotion",
+    "action": "action",
+    "reaction": "reaction",
+    "object_focus": "focus",
+    "reveal": "climax",
+    "impact_silence": "climax",
+}
+
+_PANEL_PURPOSE_MAP = {
+    "dialogue_medium": "dialogue",
+    "emotion_closeup": "reaction",
+    "reaction": "reaction",
+    "action": "action",
+    "object_focus": "reveal",
+    "reveal": "reveal",
+    "impact_silence": "silent_beat",
+    "establishing": "establishing",
+}
+
+
 def _grammar_story_function(grammar_id: str) -> str:
-    mapping = {
-        "establishing": "setup",
-        "dialogue_medium": "dialogue",
-        "emotion_closeup": "emotion",
-        "action": "action",
-        "reaction": "reaction",
-        "object_focus": "focus",
-        "reveal": "climax",
-        "impact_silence": "climax",
-    }
-    return mapping.get(grammar_id, "beat")
+    return _GRAMMAR_STORY_FUNCTION_MAP.get(grammar_id, "beat")
 
 
 def _normalize_panel_plan(panel_plan: dict) -> dict:
@@ -42,22 +97,31 @@ def _normalize_panel_plan(panel_plan: dict) -> dict:
     if not panels:
         return {"panels": []}
 
+    # Dominant case: the plan is already well-formed, so skip the record
+    # round-trip (and its per-panel dict copies) entirely.
+    if all(
+        isinstance(panel, dict)
+        and panel.get("grammar_id") in VALID_GRAMMAR_IDS
+        and panel.get("story_function")
+        for panel in panels
+    ):
+        return {"panels": panels}
+
+    records = _to_panel_records(panels)
+
     # Validate grammar_ids and replace invalid ones
-    for panel in panels:
-        grammar_id = panel.get("grammar_id")
-        if grammar_id not in VALID_GRAMMAR_IDS:
-            panel["grammar_id"] = "dialogue_medium"
-            if not panel.get("story_function"):
-                panel["story_function"] = _grammar_story_function("dialogue_medium")
-        
+    for rec in records:
+        if rec.grammar_id not in VALID_GRAMMAR_IDS:
+            rec.grammar_id = "dialogue_medium"
+
         # Ensure story_function is populated
-        if not panel.get("story_function"):
-            panel["story_function"] = _grammar_story_function(panel.get("grammar_id", "dialogue_medium"))
+        if not rec.story_function:
+            rec.story_function = _grammar_story_function(rec.grammar_id)
 
     # We removed strict constraints (establishing start, max closeups, repeated framing)
     # to allow the LLM's visual intent to drive the plan.
 
-    return {"panels": panels}
+    return {"panels": _records_to_panels(records)}
 
 
 def _panel_purpose_from(panel: dict) -> str:
@@ -65,17 +129,7 @@ def _panel_purpose_from(panel: dict) -> str:
     story_function = panel.get("story_function")
     if story_function:
         return str(story_function)
-    mapping = {
-        "dialogue_medium": "dialogue",
-        "emotion_closeup": "reaction",
-        "reaction": "reaction",
-        "action": "action",
-        "object_focus": "reveal",
-        "reveal": "reveal",
-        "impact_silence": "silent_beat",
-        "establishing": "establishing",
-    }
-    return mapping.get(grammar_id, "dialogue")
+    return _PANEL_PURPOSE_MAP.get(grammar_id, "dialogue")
 
 
 def _annotate_panel_utility(panel: dict) -> dict:
@@ -120,7 +174,10 @@ def _evaluate_and_prune_panel_plan(panel_plan: dict) -> dict:
     if not panels:
         return {"panels": []}
 
-    annotated = [_annotate_panel_utility(dict(panel)) for panel in panels]
+    # Annotate in place; both callers hand over freshly parsed plan dicts
+    # and _assign_panel_weights downstream already mutates panels, so the
+    # per-panel defensive copies bought nothing.
+    annotated = [_annotate_panel_utility(panel) for panel in panels]
 
     meaningful = {"reveal", "reaction", "action", "silent_beat"}
     pruned = []
@@ -7,7 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import loaders
-from app.db.models import Character, Scene, StoryCharacter
+from app.db.models import Character, CharacterReferenceImage, Scene, StoryCharacter
 from app.graphs.nodes.helpers.text import _split_sentences
 
 _ACTION_WORDS = {
@@ -75,6 +75,13 @@ _EMOTION_WORDS = {
 
 _DIALOGUE_MARKERS = {"\"", "“", "”"}
 
+# Alternations over the word sets keep the substring semantics of the old
+# `any(word in lower ...)` scans while touching the text once per class;
+# longest-first ordering keeps inflected forms winning over their stems.
+_ACTION_RE = re.compile("|".join(re.escape(w) for w in sorted(_ACTION_WORDS, key=len, reverse=True)))
+_EMOTION_RE = re.compile("|".join(re.escape(w) for w in sorted(_EMOTION_WORDS, key=len, reverse=True)))
+_DIALOGUE_MARKER_RE = re.compile('["“”]')
+
 
 def _coerce_scene_id(scene_id: uuid.UUID | str) -> uuid.UUID:
     if isinstance(scene_id, uuid.UUID):
@@ -82,27 +89,100 @@ def _coerce_scene_id(scene_id: uuid.UUID | str) -> uuid.UUID:
     return uuid.UUID(str(scene_id))
 
 
-def _get_scene(db: Session, scene_id: "uuid.UUID" | str) -> Scene:
-    scene = db.get(Scene, _coerce_scene_id(scene_id))
+def _get_scene(db: Session, scene_id: "uuid.UUID" | str, options: list | None = None) -> Scene:
+    scene = db.get(Scene, _coerce_scene_id(scene_id), options=options)
     if scene is None:
         raise ValueError(f"scene not found: {scene_id}")
     return scene
 
 
 def _list_characters(db: Session, story_id: "uuid.UUID") -> list[Character]:
+    """List a story's characters, cached per session.
+
+    Several nodes in one scene pipeline ask for the same story's cast;
+    stashing the result in ``Session.info`` means only the first caller on
+    a given session pays the query. The cache dies with the session, so it
+    cannot outlive the unit of work that populated it.
+
+    Everything downstream reads plain mapped columns (``name``, ``role``,
+    ``appearance`` is a JSON column, etc.), so no eager-load options are
+    needed here; add ``selectinload`` only if a relationship attribute
+    starts being accessed on the returned characters.
+    """
+    cache = db.info.setdefault("_characters_by_story", {})
+    characters = cache.get(story_id)
+    if characters is None:
+        stmt = (
+            select(Character)
+            .join(StoryCharacter, StoryCharacter.character_id == Character.character_id)
+            .where(StoryCharacter.story_id == story_id)
+        )
+        characters = list(db.execute(stmt).scalars().all())
+        cache[story_id] = characters
+    return characters
+
+
+def _load_characters_with_face_refs(
+    db: Session, story_id: "uuid.UUID"
+) -> tuple[list[Character], set["uuid.UUID"]]:
+    """Load a story's characters and which of them have an approved face ref.
+
+    Single outer-joined query replacing the separate `_list_characters` +
+    `_character_ids_with_reference_images` round-trips on render paths.
+    """
     stmt = (
-        select(Character)
+        select(Character, CharacterReferenceImage.reference_image_id)
         .join(StoryCharacter, StoryCharacter.character_id == Character.character_id)
+        .outerjoin(
+            CharacterReferenceImage,
+            (CharacterReferenceImage.character_id == Character.character_id)
+            & (CharacterReferenceImage.ref_type == "face")
+            & CharacterReferenceImage.approved.is_(True),
+        )
         .where(StoryCharacter.story_id == story_id)
     )
-    return list(db.execute(stmt).scalars().all())
+    characters: list[Character] = []
+    with_face: set[uuid.UUID] = set()
+    seen: set[uuid.UUID] = set()
+    for character, ref_id in db.execute(stmt):
+        if character.character_id not in seen:
+            seen.add(character.character_id)
+            characters.append(character)
+        if ref_id is not None:
+            with_face.add(character.character_id)
+    return characters, with_face
+
+
+_env_keywords: tuple[int, re.Pattern[str] | None] | None = None
+
+
+def _env_keywords_re() -> re.Pattern[str] | None:
+    """Compiled alternation over the configured environment keywords.
+
+    One regex pass replaces the per-keyword substring scans; longer
+    keywords sort first so overlapping entries match their longest form.
+    Re-snapshotted when the config version changes so live config reloads
+    pick up edited keyword lists.
+    """
+    global _env_keywords
+    version = loaders.get_config_version()
+    if _env_keywords is None or _env_keywords[0] != version:
+        keywords = loaders.load_qc_rules_v1().environment_keywords
+        pattern = None
+        if keywords:
+            pattern = re.compile(
+                "|".join(re.escape(k.lower()) for k in sorted(keywords, key=len, reverse=True))
+            )
+        _env_keywords = (version, pattern)
+    return _env_keywords[1]
 
 
 def _extract_setting(text: str) -> str | None:
-    for keyword in loaders.load_qc_rules_v1().environment_keywords:
-        if keyword in (text or "").lower():
-            return keyword
-    return None
+    pattern = _env_keywords_re()
+    if pattern is None:
+        return None
+    match = pattern.search((text or "").lower())
+    return match.group(0) if match else None
 
 
 def _extract_beats(text: str, max_beats: int = 3) -> list[str]:
@@ -113,10 +193,10 @@ def _extract_beats(text: str, max_beats: int = 3) -> list[str]:
 
 def _choose_mid_grammar(scene_text: str) -> str:
     lower = (scene_text or "").lower()
-    if any(word in lower for word in _ACTION_WORDS):
+    if _ACTION_RE.search(lower):
         return "action"
-    if any(marker in scene_text for marker in _DIALOGUE_MARKERS) or "said" in lower:
+    if _DIALOGUE_MARKER_RE.search(scene_text) or "said" in lower:
         return "dialogue_medium"
-    if any(word in lower for word in _EMOTION_WORDS):
+    if _EMOTION_RE.search(lower):
         return "emotion_closeup"
     return "dialogue_medium"
@@ -1,11 +1,25 @@
 import re
 
+_TOKEN_RE = re.compile(r"\w+")
 
-def _rough_similarity(text_a: str, text_b: str) -> float:
-    tokens_a = set(re.findall(r"\w+", text_a.lower()))
-    tokens_b = set(re.findall(r"\w+", text_b.lower()))
+
+def _tokenize(text: str) -> frozenset[str]:
+    """Lowercased word-token set for Jaccard comparisons.
+
+    Callers comparing one text against many should tokenize it once and
+    pass the result to ``_rough_similarity`` instead of re-tokenizing per
+    pair.
+    """
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def _rough_similarity(text_a: str | frozenset[str], text_b: str | frozenset[str]) -> float:
+    tokens_a = text_a if isinstance(text_a, frozenset) else _tokenize(text_a)
+    tokens_b = text_b if isinstance(text_b, frozenset) else _tokenize(text_b)
     if not tokens_a or not tokens_b:
         return 0.0
-    intersection = tokens_a.intersection(tokens_b)
-    union = tokens_a.union(tokens_b)
-    return len(intersection) / max(1, len(union))
+    # Inclusion-exclusion instead of materializing the union set; both sets
+    # are non-empty here so the denominator is always >= 1.
+    intersection = len(tokens_a & tokens_b)
+    union = len(tokens_a) + len(tokens_b) - intersection
+    return intersection / union
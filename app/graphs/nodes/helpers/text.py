@@ -209,21 +209,55 @@ _NAME_STOPWORDS = {
 }
 
 
+_SENTENCE_TERMINATORS = ".!?"
+_WORD_RE = re.compile(r"\w+")
+_NAME_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b")
+_META_LABELS = ("title", "episode", "story", "genre", "style")
+_META_LABEL_SET = frozenset(_META_LABELS)
+
+
 def _split_sentences(text: str) -> list[str]:
-    parts = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [p.strip() for p in parts if p.strip()]
+    # Linear scan instead of re.split(r"(?<=[.!?])\s+", ...): the lookbehind
+    # pattern hits the regex engine's slow path on long punctuation-less text,
+    # while this stays O(len(text)) with no intermediate allocations.
+    s = text.strip()
+    if not s:
+        return []
+    parts: list[str] = []
+    n = len(s)
+    start = 0
+    i = 0
+    while i < n:
+        if s[i] in _SENTENCE_TERMINATORS and i + 1 < n and s[i + 1].isspace():
+            part = s[start : i + 1].strip()
+            if part:
+                parts.append(part)
+            i += 2
+            while i < n and s[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    tail = s[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
 
 
 def _extract_names(text: str, excluded: set[str] | None = None) -> list[str]:
     excluded = excluded or set()
-    candidates = re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b", text or "")
+    candidates = _NAME_RE.findall(text or "")
+    # Dedup through a set guard; `candidate not in names` on the list was
+    # quadratic in texts with many repeated capitalized tokens.
+    seen: set[str] = set()
     names: list[str] = []
     for candidate in candidates:
         if candidate in _NAME_STOPWORDS:
             continue
         if candidate in excluded:
             continue
-        if candidate not in names:
+        if candidate not in seen:
+            seen.add(candidate)
             names.append(candidate)
     return names
 
@@ -232,21 +266,21 @@ def _extract_metadata_names(text: str) -> set[str]:
     excluded: set[str] = set()
     for line in (text or "").splitlines()[:20]:
         stripped = line.strip()
-        lower = stripped.lower()
         if ":" in line:
             label, rest = line.split(":", 1)
-            label_key = label.strip().lower()
-            if label_key in {"title", "episode", "story", "genre", "style"}:
-                for candidate in re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b", rest):
-                    excluded.add(candidate)
-        elif any(lower.startswith(prefix) for prefix in ("title", "episode", "story", "genre", "style")):
-            for candidate in re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b", stripped):
-                excluded.add(candidate)
+            if label.strip().lower() in _META_LABEL_SET:
+                excluded.update(_NAME_RE.findall(rest))
+        elif stripped.lower().startswith(_META_LABELS):
+            excluded.update(_NAME_RE.findall(stripped))
     return excluded
 
 
 def _summarize_text(text: str, max_words: int = 32) -> str:
-    words = re.findall(r"\w+", text)
-    if not words:
-        return ""
-    return " ".join(words[:max_words])
+    # Stop tokenizing once the summary window is full instead of
+    # materializing every word in the (possibly multi-KB) scene text.
+    words: list[str] = []
+    for match in _WORD_RE.finditer(text):
+        words.append(match.group())
+        if len(words) >= max_words:
+            break
+    return " ".join(words)
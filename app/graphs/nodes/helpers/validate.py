@@ -0,0 +1,58 @@
+"""Precompiled schema validators for parsed LLM payloads.
+
+fastjsonschema compiles a JSON schema into a plain Python function once at
+import time, so the per-call cost is a fast closure instead of re-walking
+the schema. Like orjson in :mod:`jsonio`, it is an optional accelerator:
+without it the validators degrade to the same shape checks the nodes used
+inline (dict with a ``panels`` list).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - exercised only without the optional dep
+    fastjsonschema = None  # type: ignore[assignment]
+
+
+_PANELS_PAYLOAD_SCHEMA = {
+    "type": "object",
+    "required": ["panels"],
+    "properties": {
+        "panels": {
+            "type": "array",
+            "items": {"type": "object"},
+        },
+    },
+}
+
+
+def _fallback_panels_validator(payload: Any) -> Any:
+    if not isinstance(payload, dict) or not isinstance(payload.get("panels"), list):
+        raise ValueError("payload must be an object with a 'panels' list")
+    return payload
+
+
+def _compile_validator(
+    schema: dict, fallback: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    return fallback
+
+
+# Shared by panel_plan and panel_semantics: both emit {"panels": [...]}.
+_validate_panels_payload = _compile_validator(
+    _PANELS_PAYLOAD_SCHEMA, _fallback_panels_validator
+)
+
+
+def _panels_payload_error(payload: Any) -> str | None:
+    """Validate a panels payload, returning an error message or None."""
+    try:
+        _validate_panels_payload(payload)
+    except Exception as exc:
+        return str(exc)
+    return None
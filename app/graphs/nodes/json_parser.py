@@ -2,6 +2,8 @@ import json
 import logging
 import re
 
+from app.graphs.nodes.helpers.jsonio import json_loads
+
 from app.core.metrics import increment_json_parse_failure
 from app.graphs.nodes.constants import SYSTEM_PROMPT_JSON
 from app.prompts.loader import render_prompt
@@ -9,18 +11,25 @@ from app.services.vertex_gemini import GeminiClient
 
 logger = logging.getLogger(__name__)
 
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 def _strip_markdown_fences(text: str) -> str:
-    """Remove markdown code fences from LLM output."""
-    patterns = [
-        r"```json\s*\n?(.*?)\n?```",
-        r"```\s*\n?(.*?)\n?```",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-    return text
+    """Remove markdown code fences from LLM output.
+
+    Single-pass find/slice instead of DOTALL regexes: on multi-kilobyte
+    responses the old patterns re-scanned the whole text per alternative.
+    """
+    start = text.find("```")
+    if start == -1:
+        return text
+    body = start + 3
+    if text[body : body + 4].lower() == "json":
+        body += 4
+    end = text.find("```", body)
+    if end == -1:
+        return text
+    return text[body:end].strip()
 
 
 def _clean_json_text(text: str) -> str:
@@ -46,7 +55,7 @@ def _clean_json_text(text: str) -> str:
 
     cleaned = "\n".join(lines[start_idx : end_idx + 1])
 
-    cleaned = re.sub(r",\s*([}\]])", r"\1", cleaned)
+    cleaned = _TRAILING_COMMA_RE.sub(r"\1", cleaned)
 
     return cleaned.strip()
 
@@ -138,14 +147,14 @@ def _repair_json_with_llm(
             repaired = gemini.generate_text(prompt=repair_prompt)
 
             try:
-                return json.loads(repaired)
+                return json_loads(repaired)
             except json.JSONDecodeError:
                 increment_json_parse_failure("repair_raw")
                 pass
 
             cleaned = _clean_json_text(repaired)
             try:
-                return json.loads(cleaned)
+                return json_loads(cleaned)
             except json.JSONDecodeError:
                 increment_json_parse_failure("repair_cleaned")
                 pass
@@ -153,7 +162,7 @@ def _repair_json_with_llm(
             obj_text = _extract_json_object(repaired)
             if obj_text:
                 try:
-                    return json.loads(obj_text)
+                    return json_loads(obj_text)
                 except json.JSONDecodeError:
                     increment_json_parse_failure("repair_object")
                     pass
@@ -161,7 +170,7 @@ def _repair_json_with_llm(
             arr_text = _extract_json_array(repaired)
             if arr_text:
                 try:
-                    return json.loads(arr_text)
+                    return json_loads(arr_text)
                 except json.JSONDecodeError:
                     increment_json_parse_failure("repair_array")
                     pass
@@ -210,15 +219,21 @@ def _maybe_json_from_gemini(
     if text is None:
         return None
 
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+    # Cheap prefilter: only attempt the direct parse when the payload can
+    # plausibly be bare JSON. Fenced or prose-wrapped output goes straight
+    # to cleanup instead of paying exception setup for a guaranteed miss.
+    text_s = text.lstrip()
+    if text_s.startswith(("{", "[")):
+        try:
+            return json_loads(text_s)
+        except json.JSONDecodeError:
+            increment_json_parse_failure("direct")
+    else:
         increment_json_parse_failure("direct")
-        pass
 
     cleaned_text = _clean_json_text(text)
     try:
-        return json.loads(cleaned_text)
+        return json_loads(cleaned_text)
     except json.JSONDecodeError:
         increment_json_parse_failure("cleaned")
         pass
@@ -226,7 +241,7 @@ def _maybe_json_from_gemini(
     obj_text = _extract_json_object(text)
     if obj_text:
         try:
-            return json.loads(obj_text)
+            return json_loads(obj_text)
         except json.JSONDecodeError:
             increment_json_parse_failure("object")
             pass
@@ -234,7 +249,7 @@ def _maybe_json_from_gemini(
     arr_text = _extract_json_array(text)
     if arr_text:
         try:
-            return json.loads(arr_text)
+            return json_loads(arr_text)
         except json.JSONDecodeError:
             increment_json_parse_failure("array")
             pass
@@ -52,6 +52,7 @@ from .art_direction import run_art_director
 # Panel planning
 from .panel_plan import (
     run_panel_plan_generator,
+    run_panel_plan_generator_batch,
     run_panel_plan_normalizer,
     run_layout_template_resolver,
 )
@@ -59,6 +60,9 @@ from .panel_plan import (
 # Panel semantics
 from .panel_semantics import run_panel_semantic_filler
 
+# Combined single-call planning
+from .combined import run_combined_scene_planner
+
 # Dialogue extraction
 from .dialogue import run_dialogue_extractor
 
@@ -93,10 +97,13 @@ __all__ = [
     "run_art_director",
     # Panel plan
     "run_panel_plan_generator",
+    "run_panel_plan_generator_batch",
     "run_panel_plan_normalizer",
     "run_layout_template_resolver",
     # Panel semantics
     "run_panel_semantic_filler",
+    # Combined single-call planning
+    "run_combined_scene_planner",
     # Dialogue
     "run_dialogue_extractor",
     # QC and evaluation
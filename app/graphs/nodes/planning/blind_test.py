@@ -17,7 +17,7 @@ from ..utils import (
     _get_scene,
     _panel_semantics_text,
     _rough_similarity,
-    _maybe_json_from_gemini,
+    _cached_json_from_gemini,
     _prompt_blind_reader,
     _prompt_comparator,
     GeminiClient,
@@ -63,9 +63,12 @@ def run_blind_test_evaluator(
                 if gemini is None:
                     raise RuntimeError("blind_test_evaluator requires Gemini client (fallback disabled)")
 
-                blind_reading = _maybe_json_from_gemini(
+                blind_reading = _cached_json_from_gemini(
+                    db,
                     gemini,
                     _prompt_blind_reader(panel_semantics.payload),
+                    "blind_test_reader",
+                    scene_id=scene_id,
                 )
                 if not blind_reading or not isinstance(blind_reading, dict):
                     raise RuntimeError("blind_test_evaluator failed: blind_reader returned invalid JSON")
@@ -74,9 +77,12 @@ def run_blind_test_evaluator(
                 emotional_takeaway = blind_reading.get("emotional_takeaway")
                 visual_observations = blind_reading.get("visual_storytelling_observations", [])
 
-                comparison_result = _maybe_json_from_gemini(
+                comparison_result = _cached_json_from_gemini(
+                    db,
                     gemini,
                     _prompt_comparator(scene.source_text, blind_reading),
+                    "blind_test_comparator",
+                    scene_id=scene_id,
                 )
                 if not comparison_result or not isinstance(comparison_result, dict):
                     raise RuntimeError("blind_test_evaluator failed: comparator returned invalid JSON")
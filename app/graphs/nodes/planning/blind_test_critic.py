@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 import uuid
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.vertex_gemini import GeminiClient
 from app.services.artifacts import ArtifactService
 from ..utils import (
@@ -30,13 +30,15 @@ def run_blind_test_critic(
         raise RuntimeError("blind_test_critic requires Gemini client (fallback disabled)")
 
     svc = ArtifactService(db)
-    reports = []
+    # Reuse each artifact's cached payload_json string instead of re-encoding
+    # the combined report list on every critic call/retry.
+    report_jsons = []
     for sid in scene_ids:
         art = svc.get_latest_artifact(uuid.UUID(sid), ARTIFACT_BLIND_TEST_REPORT)
         if art:
-            reports.append(art.payload)
+            report_jsons.append(art.payload_json)
 
-    if not reports:
+    if not report_jsons:
         logger.error("blind_test_critic fail-fast: no blind test reports available")
         raise ValueError("blind_test_critic requires blind_test_report artifacts")
 
@@ -44,9 +46,9 @@ def run_blind_test_critic(
         "prompt_blind_test_critic",
         story_text=story_text,
         episode_intent=script.get("episode_intent", "Unknown") if script else "Unknown",
-        tone_analysis=json.dumps(tone_analysis or {}, ensure_ascii=False),
-        quality_signals_json=json.dumps(quality_signals or {}, ensure_ascii=False),
-        reports_json=json.dumps(reports, ensure_ascii=False, indent=2),
+        tone_analysis=json_dumps(tone_analysis or {}),
+        quality_signals_json=json_dumps(quality_signals or {}),
+        reports_json="[\n" + ",\n".join(report_jsons) + "\n]",
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
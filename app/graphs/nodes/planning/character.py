@@ -122,19 +122,18 @@ def normalize_character_profiles(profiles: Iterable[dict]) -> list[dict]:
         if not name:
             unnamed_count += 1
             name = f"Unnamed Character {unnamed_count}"
-        key = name.lower()
+        # casefold() rather than lower() so dedup is Unicode-correct for
+        # non-ASCII casts.
+        key = name.casefold()
         if key in seen:
             continue
         seen.add(key)
 
         role = (profile.get("role") or "secondary").strip() or "secondary"
         description = profile.get("description")
-        identity_line = profile.get("identity_line")
-        if not identity_line:
-            if description:
-                identity_line = f"{name}: {description}"
-            else:
-                identity_line = f"{name}: {role} character."
+        identity_line = profile.get("identity_line") or (
+            f"{name}: {description}" if description else f"{name}: {role} character."
+        )
 
         normalized.append(
             {
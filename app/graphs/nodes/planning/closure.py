@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.artifacts import ArtifactService
 from app.services.vertex_gemini import GeminiClient
 from app.graphs.nodes.constants import ARTIFACT_CLOSURE_PLAN, ARTIFACT_TRANSITION_MAP
@@ -47,7 +47,7 @@ def run_closure_planner(
 
     for trans in transitions:
         rendered_prompt = _prompt_closure_planner(
-            panel_pair_json=json.dumps(trans, ensure_ascii=False, indent=2)
+            panel_pair_json=json_dumps(trans, indent=True)
         )
         result = _maybe_json_from_gemini(gemini, rendered_prompt)
         if result:
@@ -0,0 +1,144 @@
+"""Combined single-call scene planning functions."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import track_graph_node
+from app.core.request_context import log_context
+from app.core.telemetry import trace_span
+from app.services.artifacts import ArtifactService
+from app.services.scene_importance import analyze_scene_importance
+
+from ..utils import (
+    logger,
+    ARTIFACT_SCENE_INTENT,
+    ARTIFACT_PANEL_PLAN,
+    ARTIFACT_PANEL_SEMANTICS,
+    _get_scene,
+    _list_characters,
+    _summarize_text,
+    _extract_setting,
+    _extract_beats,
+    _evaluate_and_prune_panel_plan,
+    _assign_panel_weights,
+    _derive_panel_plan_features,
+    _maybe_json_from_gemini,
+    _prompt_combined_scene_plan,
+    GeminiClient,
+)
+from .panel_semantics import _detect_style_keywords_in_panel_semantics
+
+
+def run_combined_scene_planner(
+    db: Session,
+    scene_id: uuid.UUID,
+    panel_count: int = 3,
+    gemini: GeminiClient | None = None,
+):
+    """Run scene intent, panel plan, and panel semantics in one Gemini call.
+
+    The split extractors (`run_scene_intent_extractor`, `run_panel_plan_generator`,
+    `run_panel_semantic_filler`) each pay a full LLM round-trip per scene. This
+    node sends a single combined-schema prompt asking for
+    ``{intent, plan, semantics}`` and splits the result into the same three
+    artifact types, so downstream nodes are unaffected.
+
+    Args:
+        db: Database session
+        scene_id: UUID of the scene to plan
+        panel_count: Target number of panels
+        gemini: GeminiClient (required; fallback disabled)
+
+    Returns:
+        Tuple of (scene_intent, panel_plan, panel_semantics) artifacts
+    """
+    with track_graph_node("scene_planning", "combined_scene_planner"):
+        with log_context(node_name="combined_scene_planner", scene_id=scene_id):
+            with trace_span("graph.combined_scene_planner", scene_id=str(scene_id)):
+                svc = ArtifactService(db)
+                scene = _get_scene(db, scene_id)
+                characters = _list_characters(db, scene.story_id)
+                character_names = [c.name for c in characters]
+
+                if gemini is None:
+                    logger.error(
+                        "combined_scene_planner fail-fast: Gemini client missing (scene_id=%s)",
+                        scene_id,
+                    )
+                    raise RuntimeError("combined_scene_planner requires Gemini client (fallback disabled)")
+
+                panel_count = max(1, min(int(panel_count or 3), 5))
+
+                llm = _maybe_json_from_gemini(
+                    gemini,
+                    _prompt_combined_scene_plan(scene.source_text, panel_count, character_names),
+                )
+                if (
+                    not isinstance(llm, dict)
+                    or not isinstance(llm.get("intent"), dict)
+                    or not isinstance(llm.get("plan"), dict)
+                    or not isinstance(llm.get("semantics"), dict)
+                ):
+                    logger.error(
+                        "combined_scene_planner generation failed: invalid Gemini JSON (scene_id=%s)",
+                        scene_id,
+                    )
+                    raise RuntimeError("combined_scene_planner failed: Gemini returned invalid JSON")
+
+                # Intent: heuristic defaults overlaid with LLM output, matching
+                # run_scene_intent_extractor's payload shape.
+                intent_payload = {
+                    "summary": _summarize_text(scene.source_text),
+                    "setting": _extract_setting(scene.source_text),
+                    "beats": _extract_beats(scene.source_text, max_beats=3),
+                    "characters": character_names,
+                    "logline": None,
+                    "pacing": "normal",
+                    "pacing_profile": "drama",
+                    "emotional_arc": None,
+                    "narrative_arc": None,
+                    "visual_motifs": [],
+                    "character_presence_map": {},
+                }
+                intent_payload = {**intent_payload, **llm["intent"]}
+                intent_artifact = svc.create_artifact_deferred(
+                    scene_id=scene_id, type=ARTIFACT_SCENE_INTENT, payload=intent_payload
+                )
+
+                # Plan: same pruning/weighting post-processing as run_panel_plan_generator.
+                plan = {"panels": llm["plan"].get("panels") or []}
+                plan = _evaluate_and_prune_panel_plan(plan)
+                importance = scene.scene_importance
+                if not importance:
+                    importance = analyze_scene_importance(scene.source_text or "").importance.value
+                plan = _assign_panel_weights(plan, importance)
+                if not isinstance(plan, dict):
+                    plan = {"panels": []}
+                if "panels" in plan and len(plan["panels"]) > 5:
+                    plan["panels"] = plan["panels"][:5]
+                    for idx, panel in enumerate(plan["panels"], start=1):
+                        panel["panel_index"] = idx
+                plan["derived_features"] = _derive_panel_plan_features(plan, character_names)
+                plan_artifact = svc.create_artifact_deferred(
+                    scene_id=scene_id, type=ARTIFACT_PANEL_PLAN, payload=plan
+                )
+
+                # Semantics: same style-keyword check as run_panel_semantic_filler.
+                semantics_payload = {"panels": llm["semantics"].get("panels") or []}
+                detected_keywords = _detect_style_keywords_in_panel_semantics(semantics_payload)
+                if detected_keywords:
+                    logger.warning(
+                        f"Cinematographer output for scene {scene_id} contains style keywords "
+                        f"(should be handled by Art Director): {detected_keywords}"
+                    )
+                semantics_artifact = svc.create_artifact_deferred(
+                    scene_id=scene_id, type=ARTIFACT_PANEL_SEMANTICS, payload=semantics_payload
+                )
+                # One commit persists all three artifacts (and their audit rows)
+                # instead of a commit per artifact.
+                db.commit()
+
+                return intent_artifact, plan_artifact, semantics_artifact
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.artifacts import ArtifactService
 from app.services.vertex_gemini import GeminiClient
 from app.graphs.nodes.prompts.builders import render_prompt
@@ -39,7 +39,7 @@ def run_dialogue_minimizer(
             "prompt_dialogue_minimizer",
             original_dialogue=dialogue,
             scene_context=beat.get("visual_action", ""),
-            speaker=json.dumps(beat.get("characters", []), ensure_ascii=False),
+            speaker=json_dumps(beat.get("characters", [])),
         )
 
         result = _maybe_json_from_gemini(gemini, rendered_prompt)
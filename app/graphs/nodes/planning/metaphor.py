@@ -8,6 +8,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.artifacts import ArtifactService
 from app.services.vertex_gemini import GeminiClient
 from app.graphs.nodes.constants import ARTIFACT_METAPHOR_DIRECTIONS, ARTIFACT_PANEL_SEMANTICS
@@ -47,8 +48,8 @@ def run_metaphor_recommender(
 
     rendered_prompt = render_prompt(
         "prompt_metaphor_recommender",
-        lexicon_json=json.dumps(lexicon, ensure_ascii=False, indent=2),
-        semantics_json=json.dumps(semantics_art.payload, ensure_ascii=False, indent=2)
+        lexicon_json=json_dumps(lexicon, indent=True),
+        semantics_json=semantics_art.payload_json
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
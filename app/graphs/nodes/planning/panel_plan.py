@@ -11,6 +11,7 @@ from app.config import loaders
 from app.core.metrics import track_graph_node
 from app.core.request_context import log_context
 from app.core.telemetry import trace_span
+from app.graphs.nodes.helpers.validate import _panels_payload_error
 from app.services.artifacts import ArtifactService
 from app.services.scene_importance import analyze_scene_importance
 
@@ -29,8 +30,10 @@ from ..utils import (
     _derive_panel_plan_features,
     _normalize_panel_plan,
     _apply_weights_to_template,
+    _cached_json_from_gemini,
     _maybe_json_from_gemini,
     _prompt_panel_plan,
+    _prompt_panel_plan_batch,
     GeminiClient,
 )
 
@@ -109,10 +112,14 @@ def run_panel_plan_generator(
                     character_names=character_names,
                     qc_rules=qc_rules,
                 )
-                llm = _maybe_json_from_gemini(gemini, prompt)
-                if not isinstance(llm, dict) or not isinstance(llm.get("panels"), list):
+                llm = _cached_json_from_gemini(
+                    db, gemini, prompt, "panel_plan_generator", scene_id=scene_id
+                )
+                schema_error = _panels_payload_error(llm)
+                if schema_error is not None:
                     logger.error(
-                        "panel_plan generation failed: invalid Gemini JSON (scene_id=%s request_id=%s model=%s prompt_len=%s)",
+                        "panel_plan generation failed: %s (scene_id=%s request_id=%s model=%s prompt_len=%s)",
+                        schema_error,
                         scene_id,
                         gemini.last_request_id,
                         gemini.last_model,
@@ -120,36 +127,162 @@ def run_panel_plan_generator(
                     )
                     raise RuntimeError("panel_plan failed: Gemini returned invalid JSON")
 
-                plan = {"panels": llm["panels"]}
+                plan = _finalize_panel_plan(
+                    db, svc, scene_id, llm["panels"], importance, character_names
+                )
 
-                plan = _evaluate_and_prune_panel_plan(plan)
-                # Assign weights and must_be_large flags to panels based on utility and scene importance
-                plan = _assign_panel_weights(plan, importance)
-                if not isinstance(plan, dict):
-                    plan = {"panels": []}
+                return svc.create_artifact(scene_id=scene_id, type=ARTIFACT_PANEL_PLAN, payload=plan)
 
-                # CRITICAL: Force panel count to max 5
-                if "panels" in plan and len(plan["panels"]) > 5:
-                    logger.warning(
-                        f"Panel plan for scene {scene_id} generated {len(plan['panels'])} panels, "
-                        f"truncating to 5 (max allowed)"
-                    )
-                    plan["panels"] = plan["panels"][:5]
-                    # Re-index panels
-                    for idx, panel in enumerate(plan["panels"], start=1):
-                        panel["panel_index"] = idx
 
-                # Try to include scene-level must_show (from visual plan) into panel plan for derived features
-                visual_plan_art = svc.get_latest_artifact(scene_id, ARTIFACT_VISUAL_PLAN)
-                if visual_plan_art and isinstance(visual_plan_art.payload, dict):
-                    plan["must_show"] = visual_plan_art.payload.get("must_show", [])
+def _finalize_panel_plan(
+    db: Session,
+    svc: ArtifactService,
+    scene_id: uuid.UUID,
+    llm_panels: list,
+    importance: str | None,
+    character_names: list[str],
+) -> dict:
+    """Shared post-processing between single and batch panel-plan generation."""
+    plan = _evaluate_and_prune_panel_plan({"panels": llm_panels})
+    # Assign weights and must_be_large flags to panels based on utility and scene importance
+    plan = _assign_panel_weights(plan, importance)
+    if not isinstance(plan, dict):
+        plan = {"panels": []}
+
+    # CRITICAL: Force panel count to max 5
+    if "panels" in plan and len(plan["panels"]) > 5:
+        logger.warning(
+            f"Panel plan for scene {scene_id} generated {len(plan['panels'])} panels, "
+            f"truncating to 5 (max allowed)"
+        )
+        plan["panels"] = plan["panels"][:5]
+        # Re-index panels
+        for idx, panel in enumerate(plan["panels"], start=1):
+            panel["panel_index"] = idx
+
+    # Try to include scene-level must_show (from visual plan) into panel plan for derived features
+    visual_plan_art = svc.get_latest_artifact(scene_id, ARTIFACT_VISUAL_PLAN)
+    if visual_plan_art and isinstance(visual_plan_art.payload, dict):
+        plan["must_show"] = visual_plan_art.payload.get("must_show", [])
+
+    # Compute and attach derived features (weights aggregates, hero count, etc.)
+    derived = _derive_panel_plan_features(plan, character_names)
+    plan["derived_features"] = derived
+    return plan
+
+
+def run_panel_plan_generator_batch(
+    db: Session,
+    scene_ids: list[uuid.UUID],
+    panel_count: int = 3,
+    gemini: GeminiClient | None = None,
+):
+    """Generate panel plans for several scenes with one Gemini request.
+
+    Bundling scenes amortizes the static instruction prefix (grammar set,
+    schema, rules) over the whole batch instead of repeating it per scene.
 
-                # Compute and attach derived features (weights aggregates, hero count, etc.)
-                characters_for_features = [c.name for c in _list_characters(db, scene.story_id)]
-                derived = _derive_panel_plan_features(plan, characters_for_features)
-                plan["derived_features"] = derived
+    Args:
+        db: Database session
+        scene_ids: Scenes to plan, processed in order
+        panel_count: Base target number of panels per scene
+        gemini: Optional GeminiClient for LLM-based generation
 
-                return svc.create_artifact(scene_id=scene_id, type=ARTIFACT_PANEL_PLAN, payload=plan)
+    Returns:
+        List of created panel_plan artifacts, in scene_ids order
+    """
+    if not scene_ids:
+        return []
+
+    with track_graph_node("scene_planning", "panel_plan_generator_batch"):
+        with trace_span("graph.panel_plan_generator_batch", scene_count=len(scene_ids)):
+            if gemini is None:
+                logger.error("panel_plan_batch fail-fast: Gemini client missing")
+                raise RuntimeError("panel_plan requires Gemini client (fallback disabled)")
+
+            svc = ArtifactService(db)
+            base_count = max(1, min(int(panel_count), 3))
+
+            entries: list[dict] = []
+            contexts: list[dict] = []
+            for idx, scene_id in enumerate(scene_ids):
+                scene = _get_scene(db, scene_id)
+                character_names = [c.name for c in _list_characters(db, scene.story_id)]
+                importance = scene.scene_importance
+                if not importance:
+                    analysis = analyze_scene_importance(scene.source_text or "")
+                    importance = analysis.importance.value
+                    scene.scene_importance = importance
+                    db.add(scene)
+                    db.commit()
+
+                scene_count = _panel_count_for_importance(
+                    importance, scene.source_text, base_count
+                )
+                scene_count = max(1, min(scene_count, 5))
+
+                intent_art = svc.get_latest_artifact(scene_id, ARTIFACT_SCENE_INTENT)
+                entries.append(
+                    {
+                        "idx": idx,
+                        "panel_count": scene_count,
+                        "importance": importance,
+                        "characters": character_names,
+                        "intent": intent_art.payload if intent_art else None,
+                        "scene_text": scene.source_text,
+                    }
+                )
+                contexts.append(
+                    {
+                        "scene_id": scene_id,
+                        "importance": importance,
+                        "character_names": character_names,
+                    }
+                )
+
+            prompt = _prompt_panel_plan_batch(entries)
+            llm = _maybe_json_from_gemini(gemini, prompt)
+            results = llm.get("results") if isinstance(llm, dict) else None
+            if not isinstance(results, list):
+                logger.error(
+                    "panel_plan_batch generation failed: invalid Gemini JSON (scene_count=%s request_id=%s model=%s prompt_len=%s)",
+                    len(scene_ids),
+                    gemini.last_request_id,
+                    gemini.last_model,
+                    len(prompt),
+                )
+                raise RuntimeError("panel_plan failed: Gemini returned invalid JSON")
+
+            panels_by_idx = {
+                result.get("idx"): result.get("panels")
+                for result in results
+                if isinstance(result, dict)
+            }
+
+            artifacts = []
+            for idx, ctx in enumerate(contexts):
+                panels = panels_by_idx.get(idx)
+                if not isinstance(panels, list):
+                    logger.error(
+                        "panel_plan_batch missing result for scene (idx=%s scene_id=%s)",
+                        idx,
+                        ctx["scene_id"],
+                    )
+                    raise RuntimeError("panel_plan failed: Gemini batch result incomplete")
+                plan = _finalize_panel_plan(
+                    db,
+                    svc,
+                    ctx["scene_id"],
+                    panels,
+                    ctx["importance"],
+                    ctx["character_names"],
+                )
+                artifacts.append(
+                    svc.create_artifact(
+                        scene_id=ctx["scene_id"], type=ARTIFACT_PANEL_PLAN, payload=plan
+                    )
+                )
+            return artifacts
 
 
 def run_panel_plan_normalizer(db: Session, scene_id: uuid.UUID):
@@ -5,12 +5,13 @@ from __future__ import annotations
 import uuid
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.metrics import track_graph_node
 from app.core.request_context import log_context
 from app.core.telemetry import trace_span
-from app.db.models import Story
+from app.db.models import Scene, Story
+from app.graphs.nodes.helpers.validate import _panels_payload_error
 from app.services.artifacts import ArtifactService
 
 from ..utils import (
@@ -19,9 +20,7 @@ from ..utils import (
     ARTIFACT_PANEL_PLAN_NORMALIZED,
     ARTIFACT_LAYOUT_TEMPLATE,
     ARTIFACT_PANEL_SEMANTICS,
-    _get_scene,
-    _list_characters,
-    _maybe_json_from_gemini,
+    _cached_json_from_gemini,
     _prompt_panel_semantics,
     GeminiClient,
 )
@@ -103,16 +102,32 @@ def run_panel_semantic_filler(
         with log_context(node_name="panel_semantic_filler", scene_id=scene_id):
             with trace_span("graph.panel_semantic_filler", scene_id=str(scene_id)):
                 svc = ArtifactService(db)
-                scene = _get_scene(db, scene_id)
-                story = db.get(Story, scene.story_id)
-                characters = _list_characters(db, scene.story_id)
-
-            scene_intent_artifact = svc.get_latest_artifact(scene_id, ARTIFACT_SCENE_INTENT)
+                # One eager query for scene + story + characters instead of
+                # three separate lookups.
+                scene = db.get(
+                    Scene,
+                    scene_id,
+                    options=[joinedload(Scene.story).selectinload(Story.characters)],
+                )
+                if scene is None:
+                    raise ValueError(f"scene not found: {scene_id}")
+                characters = list(scene.story.characters) if scene.story else []
+
+            artifacts = svc.get_latest_artifacts_by_types(
+                scene_id,
+                [
+                    ARTIFACT_SCENE_INTENT,
+                    ARTIFACT_PANEL_PLAN_NORMALIZED,
+                    ARTIFACT_PANEL_PLAN,
+                    ARTIFACT_LAYOUT_TEMPLATE,
+                ],
+            )
+            scene_intent_artifact = artifacts.get(ARTIFACT_SCENE_INTENT)
             scene_intent = scene_intent_artifact.payload if scene_intent_artifact else None
-            panel_plan = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_PLAN_NORMALIZED)
-            if panel_plan is None:
-                panel_plan = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_PLAN)
-            layout = svc.get_latest_artifact(scene_id, ARTIFACT_LAYOUT_TEMPLATE)
+            panel_plan = artifacts.get(ARTIFACT_PANEL_PLAN_NORMALIZED) or artifacts.get(
+                ARTIFACT_PANEL_PLAN
+            )
+            layout = artifacts.get(ARTIFACT_LAYOUT_TEMPLATE)
 
             if panel_plan is None or layout is None:
                 raise ValueError("panel_plan and layout_template artifacts are required")
@@ -128,10 +143,14 @@ def run_panel_semantic_filler(
                 characters,
                 scene_intent=scene_intent,
             )
-            llm = _maybe_json_from_gemini(gemini, prompt)
-            if not isinstance(llm, dict) or not isinstance(llm.get("panels"), list):
+            llm = _cached_json_from_gemini(
+                db, gemini, prompt, "panel_semantic_filler", scene_id=scene_id
+            )
+            schema_error = _panels_payload_error(llm)
+            if schema_error is not None:
                 logger.error(
-                    "panel_semantics generation failed: invalid Gemini JSON (scene_id=%s request_id=%s model=%s prompt_len=%s)",
+                    "panel_semantics generation failed: %s (scene_id=%s request_id=%s model=%s prompt_len=%s)",
+                    schema_error,
                     scene_id,
                     gemini.last_request_id,
                     gemini.last_model,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from typing import Any
 
@@ -40,7 +39,7 @@ def run_presence_mapper(
 
     rendered_prompt = render_prompt(
         "prompt_presence_mapper",
-        scene_data_json=json.dumps(semantics_art.payload, ensure_ascii=False, indent=2)
+        scene_data_json=semantics_art.payload_json
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
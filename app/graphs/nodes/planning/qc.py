@@ -34,10 +34,18 @@ def run_qc_checker(db: Session, scene_id: uuid.UUID):
         with log_context(node_name="qc_checker", scene_id=scene_id):
             with trace_span("graph.qc_checker", scene_id=str(scene_id)):
                 svc = ArtifactService(db)
-                panel_plan = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_PLAN_NORMALIZED)
-                if panel_plan is None:
-                    panel_plan = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_PLAN)
-                panel_semantics = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_SEMANTICS)
+                artifacts = svc.get_latest_artifacts_by_types(
+                    scene_id,
+                    [
+                        ARTIFACT_PANEL_PLAN_NORMALIZED,
+                        ARTIFACT_PANEL_PLAN,
+                        ARTIFACT_PANEL_SEMANTICS,
+                    ],
+                )
+                panel_plan = artifacts.get(ARTIFACT_PANEL_PLAN_NORMALIZED) or artifacts.get(
+                    ARTIFACT_PANEL_PLAN
+                )
+                panel_semantics = artifacts.get(ARTIFACT_PANEL_SEMANTICS)
 
                 if panel_plan is None:
                     raise ValueError("panel_plan artifact not found")
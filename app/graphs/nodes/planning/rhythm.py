@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from typing import Any
 
@@ -38,22 +37,32 @@ def run_vertical_rhythm_planner(
     if existing:
         return existing
 
-    # We need the panel plan to determine rhythm
-    panel_plan_art = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_PLAN)
+    # We need the panel plan to determine rhythm; fetch the supporting
+    # artifacts in the same round-trip.
+    artifacts = svc.get_latest_artifacts_by_types(
+        scene_id,
+        [
+            ARTIFACT_PANEL_PLAN,
+            ARTIFACT_TRANSITION_MAP,
+            ARTIFACT_CLOSURE_PLAN,
+            ARTIFACT_SCENE_INTENT,
+        ],
+    )
+    panel_plan_art = artifacts.get(ARTIFACT_PANEL_PLAN)
     if not panel_plan_art:
         logger.error(f"rhythm_planner fail-fast: panel plan missing (scene_id={scene_id})")
         raise ValueError("rhythm_planner requires panel_plan artifact")
 
-    transition_art = svc.get_latest_artifact(scene_id, ARTIFACT_TRANSITION_MAP)
-    closure_art = svc.get_latest_artifact(scene_id, ARTIFACT_CLOSURE_PLAN)
-    intent_art = svc.get_latest_artifact(scene_id, ARTIFACT_SCENE_INTENT)
+    transition_art = artifacts.get(ARTIFACT_TRANSITION_MAP)
+    closure_art = artifacts.get(ARTIFACT_CLOSURE_PLAN)
+    intent_art = artifacts.get(ARTIFACT_SCENE_INTENT)
 
     rendered_prompt = render_prompt(
         "prompt_vertical_rhythm_planner",
-        scene_data_json=json.dumps(panel_plan_art.payload, ensure_ascii=False, indent=2),
-        transition_map_json=json.dumps((transition_art.payload if transition_art else {}), ensure_ascii=False, indent=2),
-        closure_plan_json=json.dumps((closure_art.payload if closure_art else {}), ensure_ascii=False, indent=2),
-        scene_intent_json=json.dumps((intent_art.payload if intent_art else {}), ensure_ascii=False, indent=2),
+        scene_data_json=panel_plan_art.payload_json,
+        transition_map_json=transition_art.payload_json if transition_art else "{}",
+        closure_plan_json=closure_art.payload_json if closure_art else "{}",
+        scene_intent_json=intent_art.payload_json if intent_art else "{}",
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
@@ -20,7 +20,7 @@ from ..utils import (
     _summarize_text,
     _extract_setting,
     _extract_beats,
-    _maybe_json_from_gemini,
+    _cached_json_from_gemini,
     _prompt_scene_intent,
     GeminiClient,
 )
@@ -67,9 +67,12 @@ def run_scene_intent_extractor(
                 "character_presence_map": {},
             }
 
-            llm = _maybe_json_from_gemini(
+            llm = _cached_json_from_gemini(
+                db,
                 gemini,
                 _prompt_scene_intent(scene.source_text, character_names),
+                "scene_intent_extractor",
+                scene_id=scene_id,
             )
             if not isinstance(llm, dict):
                 logger.error("scene_intent generation failed: invalid Gemini JSON (scene_id=%s)", scene_id)
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.vertex_gemini import GeminiClient
 from ..utils import (
     logger,
@@ -73,12 +73,12 @@ def run_webtoon_script_writer(
     rendered_prompt = render_prompt(
         "prompt_script_writer",
         story_text=story_text,
-        characters_json=json.dumps(characters, ensure_ascii=False, indent=2),
+        characters_json=json_dumps(characters, indent=True),
         target_scene_count=max(1, int(target_scene_count or 6)),
         story_style=story_style or "General",
-        story_profile_json=json.dumps(story_profile, ensure_ascii=False, indent=2) if story_profile else None,
+        story_profile_json=json_dumps(story_profile, indent=True) if story_profile else None,
         feedback="\n".join(feedback) if feedback else None,
-        history=json.dumps(history, ensure_ascii=False, indent=2) if history else None,
+        history=json_dumps(history, indent=True) if history else None,
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.vertex_gemini import GeminiClient
 from ..utils import (
     logger,
@@ -122,7 +122,7 @@ def run_studio_director(
         "prompt_studio_director",
         max_scenes=max_scenes,
         episode_intent=script.get("episode_intent", "Unknown"),
-        beats_json=json.dumps(script.get("visual_beats", []), ensure_ascii=False, indent=2),
+        beats_json=json_dumps(script.get("visual_beats", []), indent=True),
         style_library=style_summary,
     )
 
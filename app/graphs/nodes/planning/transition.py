@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from enum import Enum
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.services.artifacts import ArtifactService
 from app.services.vertex_gemini import GeminiClient
 from app.graphs.nodes.constants import ARTIFACT_TRANSITION_MAP
@@ -52,7 +52,7 @@ def run_transition_type_classifier(
         return svc.create_artifact(scene_id, ARTIFACT_TRANSITION_MAP, {"transitions": []})
 
     rendered_prompt = _prompt_transition_classifier(
-        visual_beats_json=json.dumps(visual_beats, ensure_ascii=False, indent=2)
+        visual_beats_json=json_dumps(visual_beats, indent=True)
     )
 
     result = _maybe_json_from_gemini(gemini, rendered_prompt)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
+from collections import OrderedDict
 
 from ..utils import (
     logger,
@@ -32,6 +34,8 @@ def compile_visual_plan_bundle(
     """
     plans: list[dict] = []
     total = len(scenes)
+    # The cast is the same for every scene; build the name list once.
+    character_names = [c.get("name") for c in characters if c.get("name")]
 
     for scene in scenes:
         summary = scene.get("summary") or _summarize_text(scene.get("source_text", ""))
@@ -52,7 +56,7 @@ def compile_visual_plan_bundle(
             "beats": _extract_beats(scene.get("source_text", ""), max_beats=3),
             "must_show": _extract_must_show(scene.get("source_text", "")),
             "scene_importance": importance,
-            "characters": [c.get("name") for c in characters if c.get("name")],
+            "characters": character_names,
         }
         plans.append(plan)
 
@@ -84,6 +88,7 @@ def compile_visual_plan_bundle_llm(
     if result and isinstance(result.get("scene_plans"), list):
         plans = []
         global_anchors = result.get("global_environment_anchors", [])
+        character_names = [c.get("name") for c in characters if c.get("name")]
 
         for scene_plan in result["scene_plans"]:
             scene_idx = scene_plan.get("scene_index")
@@ -96,7 +101,7 @@ def compile_visual_plan_bundle_llm(
                 "scene_importance": scene_plan.get("scene_importance"),
                 "beats": scene_plan.get("beats", []),
                 "must_show": scene_plan.get("must_show", []),
-                "characters": [c.get("name") for c in characters if c.get("name")],
+                "characters": character_names,
                 "global_environment_anchors": global_anchors,
             }
 
@@ -113,6 +118,15 @@ def compile_visual_plan_bundle_llm(
     raise RuntimeError("visual_plan_compiler failed: Gemini returned invalid JSON")
 
 
+_MARKER_SPLIT_RE = re.compile(r"\n(?=\s*(?:Scene|Chapter|Part)\b)", re.IGNORECASE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n+")
+
+# Chunker output cache keyed by (sha256(text), max_scenes) so regeneration
+# workflows reuse earlier splits instead of re-chunking identical stories.
+_CHUNK_CACHE_MAX = 128
+_chunk_cache: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
+
+
 def compute_scene_chunker(source_text: str, max_scenes: int = 6) -> list[str]:
     """Split story text into scene chunks.
 
@@ -131,16 +145,35 @@ def compute_scene_chunker(source_text: str, max_scenes: int = 6) -> list[str]:
 
     max_scenes = max(1, int(max_scenes))
 
-    # Prefer explicit scene/section markers when present
-    marker_split = re.split(r"\n(?=\s*(?:Scene|Chapter|Part)\b)", text, flags=re.IGNORECASE)
-    marker_chunks = [p.strip() for p in marker_split if p.strip()]
-    if len(marker_chunks) >= 2:
-        return marker_chunks[:max_scenes]
-
-    # Fall back to paragraph splitting
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n+", text) if p.strip()]
-    if len(paragraphs) >= 2:
-        return _group_chunks(paragraphs, max_scenes)
+    key = (hashlib.sha256(text.encode("utf-8")).hexdigest(), max_scenes)
+    cached = _chunk_cache.get(key)
+    if cached is not None:
+        _chunk_cache.move_to_end(key)
+        return list(cached)
+
+    chunks = _compute_chunks(text, max_scenes)
+    _chunk_cache[key] = list(chunks)
+    if len(_chunk_cache) > _CHUNK_CACHE_MAX:
+        _chunk_cache.popitem(last=False)
+    return chunks
+
+
+def _compute_chunks(text: str, max_scenes: int) -> list[str]:
+    # Both the marker and paragraph patterns anchor on a newline, so
+    # newline-free text can skip straight to sentence splitting.
+    if "\n" in text:
+        # Prefer explicit scene/section markers when present
+        marker_split = _MARKER_SPLIT_RE.split(text)
+        # map(str.strip, ...) strips each part once instead of once in the
+        # filter and again for the kept value.
+        marker_chunks = [s for s in map(str.strip, marker_split) if s]
+        if len(marker_chunks) >= 2:
+            return marker_chunks[:max_scenes]
+
+        # Fall back to paragraph splitting
+        paragraphs = [s for s in map(str.strip, _PARAGRAPH_SPLIT_RE.split(text)) if s]
+        if len(paragraphs) >= 2:
+            return _group_chunks(paragraphs, max_scenes)
 
     # Fall back to sentence splitting
     sentences = _split_sentences(text)
@@ -1,10 +1,10 @@
-import json
 import uuid
 
 from app.db.models import Character
 from app.graphs.nodes.constants import GLOBAL_CONSTRAINTS, SYSTEM_PROMPT_JSON
 from app.graphs.nodes.helpers.character import get_character_style_prompt
 from app.graphs.nodes.helpers.dialogue import _dialogue_panel_ids
+from app.graphs.nodes.helpers.jsonio import json_dumps
 from app.prompts.loader import render_prompt
 
 
@@ -79,6 +79,23 @@ def _prompt_scene_intent(scene_text: str, character_names: list[str] | None = No
     )
 
 
+def _prompt_combined_scene_plan(
+    scene_text: str,
+    panel_count: int,
+    character_names: list[str] | None = None,
+) -> str:
+    """Single-call planning prompt: intent + panel plan + semantics in one JSON."""
+    char_list = ", ".join(character_names) if character_names else "unknown"
+
+    return render_prompt(
+        "prompt_combined_scene_plan",
+        global_constraints=GLOBAL_CONSTRAINTS,
+        panel_count=panel_count,
+        char_list=char_list,
+        scene_text=scene_text,
+    )
+
+
 def _prompt_panel_plan(
     scene_text: str,
     panel_count: int,
@@ -121,6 +138,21 @@ Scene Intent:
     )
 
 
+def _prompt_panel_plan_batch(scenes: list[dict]) -> str:
+    """Panel plan generation prompt covering several scenes in one request.
+
+    ``scenes`` entries carry ``idx``, ``panel_count``, ``scene_text``, and
+    optional ``intent``/``importance``/``characters``; the static
+    instruction prefix is shared across every batch so provider prompt
+    caching amortizes it.
+    """
+    return render_prompt(
+        "prompt_panel_plan_batch",
+        global_constraints=GLOBAL_CONSTRAINTS,
+        scenes_json=json_dumps(scenes, indent=True),
+    )
+
+
 def _prompt_panel_semantics(
     scene_text: str,
     panel_plan: dict,
@@ -255,7 +287,7 @@ def _prompt_character_extraction(
     character_hints: list[dict] | None = None,
 ) -> str:
     """Prompt for LLM-based character extraction."""
-    hints_json = json.dumps(character_hints or [], ensure_ascii=False, indent=2)
+    hints_json = json_dumps(character_hints or [], indent=True)
     return render_prompt(
         "prompt_character_extraction",
         system_prompt_json=SYSTEM_PROMPT_JSON,
@@ -272,7 +304,7 @@ def _prompt_character_normalization(
     style_id: str | None = None,
 ) -> str:
     """Prompt for LLM-based character enrichment with Korean manhwa aesthetics."""
-    char_list = json.dumps(characters, indent=2)
+    char_list = json_dumps(characters, indent=True)
 
     image_style_guide = None
     character_style_guide = None
@@ -1,10 +1,31 @@
+import io
 import re
+import sys
 import uuid
 
 from app.config import loaders
 from app.db.models import Character, CharacterVariant
 from app.graphs.nodes.helpers.character import _character_codes, _inject_character_identities
 
+# Lazy module-level snapshot of the grammar->prompt mapping, keyed on the
+# config version so clear_config_cache() still takes effect.
+_grammar_mapping: tuple[int, dict[str, str]] | None = None
+
+
+def _grammar_prompt_mapping() -> dict[str, str]:
+    global _grammar_mapping
+    version = loaders.get_config_version()
+    if _grammar_mapping is None or _grammar_mapping[0] != version:
+        # Intern ids and hints once per config version so the per-panel dict
+        # lookups below compare interned pointers instead of hashing fresh
+        # strings each time.
+        mapping = {
+            sys.intern(gid): sys.intern(hint)
+            for gid, hint in loaders.load_grammar_to_prompt_mapping_v1().mapping.items()
+        }
+        _grammar_mapping = (version, mapping)
+    return _grammar_mapping[1]
+
 
 def _compile_prompt(
     panel_semantics: dict,
@@ -17,16 +38,21 @@ def _compile_prompt(
 ) -> str:
     """Compile a production-grade image generation prompt with layered hierarchy.
     
-    Prompt Layering Hierarchy (highest to lowest priority):
+    Emission order puts the scene-invariant layers first so provider-side
+    prompt caching can reuse the shared prefix across a story's scenes:
+
+    Static prefix (identical for a given style):
     1. Image Style (user-selected, highest authority)
-    2. Art Direction (mood & atmosphere from Art Director)
-    3. Format & Composition (technical requirements)
-    4. Reference Image Authority (character consistency)
-    5. Panel Composition (cinematographer's layout)
-    6. Characters (morphology only, style-neutral)
-    7. Panels (scene-specific visual descriptions)
-    8. Technical Requirements (style-agnostic quality standards)
-    9. Negative Prompt (what to avoid)
+    2. Format & Composition (technical requirements)
+    3. Reference Image Authority (character consistency)
+    4. Technical Requirements (style-agnostic quality standards)
+    5. Negative Prompt (what to avoid)
+
+    Dynamic tail (varies per scene):
+    6. Art Direction (mood & atmosphere from Art Director)
+    7. Panel Composition (cinematographer's layout)
+    8. Characters (morphology only, style-neutral)
+    9. Panels (scene-specific visual descriptions)
     
     Args:
         panel_semantics: Panel descriptions from cinematographer
@@ -43,55 +69,46 @@ def _compile_prompt(
     Raises:
         ValueError: If prompt validation fails (forbidden anchors detected or expected style missing)
     """
-    style_desc_raw = _style_description(style_id)
-    style_desc, _ = _strip_forbidden_style_anchors(style_desc_raw)
+    style_desc, _ = _strip_forbidden_style_anchors(_style_description(style_id))
     layout_text = layout_template.get("layout_text", "")
     reference_char_ids = reference_char_ids or set()
+    # Assign canonical codes once; both the identity injection and the
+    # character layer below consume the same mapping.
+    character_codes = _character_codes(characters) if characters else {}
     panel_semantics = _inject_character_identities(
         panel_semantics=panel_semantics,
         characters=characters,
         reference_char_ids=reference_char_ids,
         variants_by_character=variants_by_character,
         style_id=style_id,
+        codes=character_codes or None,
     )
     panels = panel_semantics.get("panels", []) or []
     panel_count = len(panels)
 
-    # Build prompt layers
-    layers = []
-    
-    # LAYER 1: Image Style (highest priority)
-    layers.append(_build_style_layer(style_desc))
-    
-    # LAYER 2: Art Direction (mood & atmosphere)
+    # Static layers first so every render of a style shares a byte-identical
+    # prefix the provider's prompt cache can reuse; scene-specific layers
+    # follow.
+    layers = [_static_prompt_prefix(style_id)]
+
+    # DYNAMIC: Art Direction (mood & atmosphere)
     if art_direction:
         layers.append(_build_art_direction_layer(art_direction))
-    
-    # LAYER 3: Format & Composition
-    layers.append(_build_format_layer())
-    
-    # LAYER 4: Reference Image Authority
-    layers.append(_build_reference_authority_layer())
-    
-    # LAYER 5: Panel Composition (cinematographer)
+
+    # DYNAMIC: Panel Composition (cinematographer)
     layers.append(_build_panel_composition_layer(layout_text, panel_count))
-    
-    # LAYER 6: Characters (morphology only)
+
+    # DYNAMIC: Characters (morphology only)
     character_layer = _build_character_layer(
-        characters, reference_char_ids, variants_by_character, style_id
+        characters, reference_char_ids, variants_by_character, style_id,
+        codes=character_codes or None,
     )
     if character_layer:
         layers.append(character_layer)
-    
-    # LAYER 7: Panels (scene-specific)
+
+    # DYNAMIC: Panels (scene-specific)
     layers.append(_build_panels_layer(panels))
-    
-    # LAYER 8: Technical Requirements
-    layers.append(_build_technical_requirements_layer())
-    
-    # LAYER 9: Negative Prompt
-    layers.append(_build_negative_prompt_layer())
-    
+
     compiled_prompt = "\n\n".join(layers)
     compiled_prompt, removed_anchors = _strip_forbidden_style_anchors(compiled_prompt)
     if removed_anchors:
@@ -108,6 +125,30 @@ def _compile_prompt(
     return compiled_prompt
 
 
+
+# Static prefix per (config version, style), so repeated renders reuse one
+# prebuilt string and keep the provider-cacheable prefix byte-stable.
+_static_prefix_cache: dict[tuple[int, str], str] = {}
+
+
+def _static_prompt_prefix(style_id: str) -> str:
+    key = (loaders.get_config_version(), style_id)
+    prefix = _static_prefix_cache.get(key)
+    if prefix is None:
+        style_desc, _ = _strip_forbidden_style_anchors(_style_description(style_id))
+        prefix = "\n\n".join(
+            [
+                _build_style_layer(style_desc),
+                _build_format_layer(),
+                _build_reference_authority_layer(),
+                _build_technical_requirements_layer(),
+                _build_negative_prompt_layer(),
+            ]
+        )
+        _static_prefix_cache[key] = prefix
+    return prefix
+
+
 def _build_style_layer(style_desc: str) -> str:
     """Layer 1: Image Style (highest priority)."""
     return f"**STYLE:** {style_desc}"
@@ -166,11 +207,15 @@ def _build_panel_composition_layer(layout_text: str, panel_count: int) -> str:
     ])
 
 
+_APPEARANCE_FIELDS = (("hair", "Hair"), ("face", "Face"), ("build", "Build"))
+
+
 def _build_character_layer(
     characters: list[Character],
     reference_char_ids: set[uuid.UUID],
     variants_by_character: dict | None,
     style_id: str,
+    codes: dict[uuid.UUID, str] | None = None,
 ) -> str | None:
     """Layer 6: Characters (morphology only, style-neutral)."""
     def _trim_outfit(text: str | None, max_words: int = 10) -> str | None:
@@ -183,7 +228,8 @@ def _build_character_layer(
         return trimmed
 
     identity_lines = []
-    codes = _character_codes(characters)
+    if codes is None:
+        codes = _character_codes(characters)
     
     for c in characters:
         code = codes.get(c.character_id)
@@ -229,15 +275,13 @@ def _build_character_layer(
             elif c.base_outfit:
                 char_lines.append(f"    Outfit: {c.base_outfit}")
             
-            appearance = getattr(c, "appearance", None)
-            if isinstance(appearance, dict):
-                brief = []
-                if appearance.get("hair"):
-                    brief.append(f"Hair: {appearance['hair']}")
-                if appearance.get("face"):
-                    brief.append(f"Face: {appearance['face']}")
-                if appearance.get("build"):
-                    brief.append(f"Build: {appearance['build']}")
+            appearance = c.appearance if isinstance(c.appearance, dict) else None
+            if appearance is not None:
+                brief = [
+                    f"{label}: {appearance[key]}"
+                    for key, label in _APPEARANCE_FIELDS
+                    if appearance.get(key)
+                ]
                 if brief:
                     char_lines.append(f"    Appearance: {'; '.join(brief)}")
             elif c.description:
@@ -255,7 +299,7 @@ def _build_character_layer(
 
 def _build_panels_layer(panels: list[dict]) -> str:
     """Layer 7: Panels (scene-specific visual descriptions)."""
-    mapping = loaders.load_grammar_to_prompt_mapping_v1().mapping
+    mapping = _grammar_prompt_mapping()
     
     def _strip_layout_tokens(text: str) -> str:
         cleaned = text
@@ -272,23 +316,32 @@ def _build_panels_layer(panels: list[dict]) -> str:
         cleaned = cleaned.strip(" ,;:-")
         return cleaned
     
-    lines = ["**PANELS (action/emotion/environment only; no text in image):**"]
-    
+    # Single-pass assembly: write lines straight into a StringIO instead of
+    # accumulating a list and re-walking it with a filtered join.
+    buf = io.StringIO()
+    write = buf.write
+    write("**PANELS (action/emotion/environment only; no text in image):**\n")
+
+    # Bind the lookups once so the loop body skips the attribute dispatch.
+    mapping_get = mapping.get
+
     for panel in panels:
-        grammar_id = panel.get("grammar_id")
-        grammar_hint = mapping.get(grammar_id, "")
-        desc = panel.get("description", "")
+        get = panel.get
+        grammar_id = get("grammar_id")
+        grammar_hint = mapping_get(grammar_id, "")
+        desc = get("description", "")
         if isinstance(desc, str) and desc:
             desc = _strip_layout_tokens(desc)
 
-        environment = panel.get("environment", {})
-        lighting = panel.get("lighting", {})
-        atmosphere = panel.get("atmosphere_keywords", [])
+        environment = get("environment", {})
+        lighting = get("lighting", {})
+        atmosphere = get("atmosphere_keywords", [])
 
-        panel_lines = [f"Panel {panel.get('panel_index')}: {grammar_hint}".strip()]
+        write(f"Panel {get('panel_index')}: {grammar_hint}".strip())
+        write("\n")
 
         if desc:
-            panel_lines.append(f"  Visual: {desc}")
+            write(f"  Visual: {desc}\n")
 
         if isinstance(environment, dict):
             env_parts = []
@@ -299,7 +352,7 @@ def _build_panels_layer(panels: list[dict]) -> str:
             if environment.get("props"):
                 env_parts.append(f"Props: {', '.join(environment['props'][:5])}")
             if env_parts:
-                panel_lines.append(f"  Environment: {'; '.join(env_parts)}")
+                write(f"  Environment: {'; '.join(env_parts)}\n")
 
         if isinstance(lighting, dict):
             light_parts = []
@@ -310,26 +363,30 @@ def _build_panels_layer(panels: list[dict]) -> str:
             if lighting.get("color_temperature"):
                 light_parts.append(f"{lighting['color_temperature']} temperature")
             if light_parts:
-                panel_lines.append(f"  Lighting: {', '.join(light_parts)}")
+                write(f"  Lighting: {', '.join(light_parts)}\n")
 
         if atmosphere:
-            panel_lines.append(f"  Atmosphere: {', '.join(atmosphere[:5])}")
+            write(f"  Atmosphere: {', '.join(atmosphere[:5])}\n")
 
-        dialogue = panel.get("dialogue") or []
+        dialogue = get("dialogue") or []
         if dialogue:
-            if isinstance(dialogue, list) and dialogue:
+            # Generators instead of intermediate lists; the type check runs
+            # once per panel rather than per join element.
+            if isinstance(dialogue, list):
                 if isinstance(dialogue[0], dict):
-                    dialogue_text = " | ".join([f"{d.get('character', '?')}: \"{d.get('text', '')}\"" for d in dialogue[:3]])
+                    dialogue_text = " | ".join(
+                        f"{d.get('character', '?')}: \"{d.get('text', '')}\"" for d in dialogue[:3]
+                    )
                 else:
-                    dialogue_text = " | ".join([f"\"{d}\"" for d in dialogue[:3]])
+                    dialogue_text = " | ".join(f"\"{d}\"" for d in dialogue[:3])
             else:
                 dialogue_text = str(dialogue)
-            panel_lines.append(f"  Dialogue context (do NOT render text): {dialogue_text}")
+            write(f"  Dialogue context (do NOT render text): {dialogue_text}\n")
 
-        lines.extend(panel_lines)
-        lines.append("")
-    
-    return "\n".join([line for line in lines if line is not None])
+        write("\n")
+
+    # The final write leaves one extra newline relative to the old join.
+    return buf.getvalue()[:-1]
 
 
 def _build_technical_requirements_layer() -> str:
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 import mimetypes
 
 from .utils import *
+from app.core.hashing import prompt_digest
 from app.core.metrics import track_graph_node
 from app.core.request_context import log_context
-from app.graphs.nodes.helpers.character import _active_variants_by_character
 from app.graphs.nodes.helpers.media import _load_character_reference_images
 from app.graphs.nodes.helpers.scene import _get_scene, _list_characters
 from app.graphs.nodes.prompts.builders import _prompt_variant_plan
-from app.graphs.nodes.utils import _character_ids_with_reference_images, _render_image_from_prompt
+from app.services.storage import default_media_store
+from app.services.story_context import load_story_context
+from app.graphs.nodes.utils import _render_image_from_prompt
 from app.config.loaders import has_image_style, load_character_style_text
 from app.core.image_styles import get_style_semantic_hint
 from app.db.models import CharacterReferenceImage, CharacterVariant
+from sqlalchemy.orm import joinedload
 
 
 def compute_prompt_compiler(
@@ -48,26 +50,33 @@ def run_prompt_compiler(
         with log_context(node_name="prompt_compiler", scene_id=scene_id):
             with trace_span("graph.prompt_compiler", scene_id=str(scene_id), style_id=style_id):
                 svc = ArtifactService(db)
-                panel_semantics = svc.get_latest_artifact(scene_id, ARTIFACT_PANEL_SEMANTICS)
-                layout = svc.get_latest_artifact(scene_id, ARTIFACT_LAYOUT_TEMPLATE)
+                artifacts = svc.get_latest_artifacts_by_types(
+                    scene_id,
+                    [ARTIFACT_PANEL_SEMANTICS, ARTIFACT_LAYOUT_TEMPLATE, ARTIFACT_ART_DIRECTION],
+                )
+                panel_semantics = artifacts.get(ARTIFACT_PANEL_SEMANTICS)
+                layout = artifacts.get(ARTIFACT_LAYOUT_TEMPLATE)
                 if panel_semantics is None or layout is None:
                     raise ValueError("panel_semantics and layout_template artifacts are required")
 
-                scene = _get_scene(db, scene_id)
-                story = db.get(Story, scene.story_id)
-                
+                # joinedload pulls the Story row in the same SELECT, so the
+                # db.get(Story) inside load_story_context resolves from the
+                # identity map instead of issuing a second query.
+                scene = _get_scene(db, scene_id, options=[joinedload(Scene.story)])
+                ctx = load_story_context(db, scene.story_id)
+                story = ctx.story
+
                 # Check for scene-level style override
                 effective_style_id = style_id or scene.image_style_override or (story.default_image_style if story else "default") or "default"
                 
-                # Load art direction artifact
-                art_direction_artifact = svc.get_latest_artifact(scene_id, ARTIFACT_ART_DIRECTION)
+                art_direction_artifact = artifacts.get(ARTIFACT_ART_DIRECTION)
                 art_direction = None
                 if art_direction_artifact and art_direction_artifact.payload:
                     art_direction = art_direction_artifact.payload
-                
-                characters = _list_characters(db, scene.story_id)
-                reference_char_ids = _character_ids_with_reference_images(db, scene.story_id)
-                variants_by_character = _active_variants_by_character(db, scene.story_id)
+
+                characters = ctx.characters
+                reference_char_ids = ctx.reference_char_ids
+                variants_by_character = ctx.variants_by_character
                 panel_count = _panel_count(panel_semantics.payload)
                 layout_panels = layout.payload.get("panels")
                 layout_count = len(layout_panels) if isinstance(layout_panels, list) else None
@@ -114,7 +123,7 @@ def run_prompt_compiler(
                     "style_id": effective_style_id,
                     "layout_template_id": layout.payload.get("template_id"),
                     "panel_count": panel_count,
-                    "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+                    "prompt_sha256": prompt_digest(prompt),
                     "active_char_ids": active_char_ids,
                     "variant_ref_ids": {str(k): str(v) for k, v in variant_ref_ids.items()},
                 }
@@ -155,11 +164,13 @@ def generate_character_reference_image(
         prompt_parts.append(f"Character style guide ({effective_style_id}): {character_style_guide}")
     prompt_parts.append("Plain background, clean silhouette, full body if possible.")
 
-    prompt = " ".join([part for part in prompt_parts if part])
+    # Optional parts are appended behind guards, so no truthy filter pass
+    # (and its second list allocation) is needed before joining.
+    prompt = " ".join(prompt_parts)
 
     image_bytes, mime_type = gemini.generate_image(prompt=prompt)
 
-    store = LocalMediaStore(root_dir=settings.media_root, url_prefix=settings.media_url_prefix)
+    store = default_media_store()
     _, url = store.save_image_bytes(image_bytes=image_bytes, mime_type=mime_type)
 
     ref = CharacterReferenceImage(
@@ -173,7 +184,7 @@ def generate_character_reference_image(
             "model": getattr(gemini, "last_model", None),
             "request_id": getattr(gemini, "last_request_id", None),
             "usage": getattr(gemini, "last_usage", None),
-            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "prompt_sha256": prompt_digest(prompt),
             "style_id": effective_style_id,
         },
     )
@@ -265,7 +276,9 @@ def generate_character_variant_reference_image(
         )
     prompt_parts.append("Plain background, clean silhouette.")
 
-    prompt = " ".join([part for part in prompt_parts if part])
+    # Optional parts are appended behind guards, so no truthy filter pass
+    # (and its second list allocation) is needed before joining.
+    prompt = " ".join(prompt_parts)
 
     ref_image = _load_reference_image_bytes(base_reference)
     image_bytes, mime_type, metadata = _render_image_from_prompt(
@@ -274,7 +287,7 @@ def generate_character_variant_reference_image(
         reference_images=[ref_image],
     )
 
-    store = LocalMediaStore(root_dir=settings.media_root, url_prefix=settings.media_url_prefix)
+    store = default_media_store()
     _, url = store.save_image_bytes(image_bytes=image_bytes, mime_type=mime_type)
 
     ref = CharacterReferenceImage(
@@ -288,7 +301,7 @@ def generate_character_variant_reference_image(
             "model": metadata.get("model"),
             "request_id": metadata.get("request_id"),
             "usage": metadata.get("usage"),
-            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "prompt_sha256": prompt_digest(prompt),
             "variant_type": variant_type,
             "override_attributes": override_attributes,
             "base_reference_id": str(base_reference.reference_image_id),
@@ -518,7 +531,7 @@ def run_image_renderer(
                     reference_images=reference_images,
                 )
 
-                store = LocalMediaStore(root_dir=settings.media_root, url_prefix=settings.media_url_prefix)
+                store = default_media_store()
                 _, url = store.save_image_bytes(image_bytes=image_bytes, mime_type=mime_type)
 
                 image = ImageService(db).create_image(
@@ -4,6 +4,7 @@ import logging
 import math
 import re
 import uuid
+from functools import lru_cache
 from typing import Iterable
 
 from sqlalchemy import select
@@ -13,7 +14,7 @@ from app.config import loaders
 from app.core.gemini_factory import build_gemini_client
 from app.core.telemetry import trace_span
 from app.core.settings import settings
-from app.db.models import Character, CharacterReferenceImage, Scene, Story, StoryCharacter
+from app.db.models import Character, CharacterReferenceImage, CharacterVariant, Scene, Story, StoryCharacter
 from app.prompts.loader import render_prompt
 from app.services.artifacts import ArtifactService
 from app.services.images import ImageService
@@ -59,9 +60,11 @@ from app.graphs.nodes.helpers.panel import (
     _evaluate_and_prune_panel_plan,
     _heuristic_panel_plan,
     _normalize_panel_plan,
+    _to_panel_records,
 )
 from app.graphs.nodes.helpers.scene import (
     _choose_mid_grammar,
+    _env_keywords_re,
     _extract_beats,
     _extract_setting,
     _get_scene,
@@ -82,9 +85,11 @@ from app.graphs.nodes.prompts.builders import (
     _prompt_blind_test,
     _prompt_character_extraction,
     _prompt_character_normalization,
+    _prompt_combined_scene_plan,
     _prompt_comparator,
     _prompt_dialogue_script,
     _prompt_panel_plan,
+    _prompt_panel_plan_batch,
     _prompt_panel_semantics,
     _prompt_scene_intent,
     _prompt_variant_suggestions,
@@ -96,23 +101,63 @@ logger = logging.getLogger(__name__)
 
 
 
+@lru_cache(maxsize=1)
 def _build_gemini_client() -> GeminiClient:
-    """Deprecated: Use app.core.gemini_factory.build_gemini_client() directly."""
+    """Deprecated: Use app.core.gemini_factory.build_gemini_client() directly.
+
+    Memoized so callers that don't pass a client share one warm instance
+    (and its HTTP connection pool) instead of reconstructing a GeminiClient
+    per node invocation. Tests that change Gemini settings must call
+    ``_build_gemini_client.cache_clear()`` to pick up the new configuration.
+    """
     return build_gemini_client()
 
 
+def _cached_json_from_gemini(
+    db: Session,
+    gemini: GeminiClient,
+    prompt: str,
+    node_name: str,
+    scene_id: uuid.UUID | None = None,
+    expected_schema: str | None = None,
+):
+    """``_maybe_json_from_gemini`` with an optional DB-backed semantic cache.
+
+    When ``settings.llm_cache_enabled`` is set, the parsed payload is stored
+    in the ``llm_cache`` table keyed by a hash of the rendered prompt, so
+    deterministic nodes skip the Gemini round-trip on re-runs and retries.
+    Hits are logged; the payload itself is returned exactly as stored so
+    artifact content never depends on cache state.
+    """
+    if not settings.llm_cache_enabled:
+        return _maybe_json_from_gemini(gemini, prompt, expected_schema=expected_schema)
+
+    from app.services import llm_cache
+
+    input_hash = llm_cache.llm_input_hash(prompt, getattr(gemini, "model", None))
+    cached = llm_cache.get_cached_payload(db, node_name, input_hash)
+    if cached is not None:
+        logger.info("llm_cache hit: node=%s hash=%s", node_name, input_hash[:12])
+        return cached
+
+    result = _maybe_json_from_gemini(gemini, prompt, expected_schema=expected_schema)
+    if isinstance(result, dict):
+        llm_cache.store_payload(
+            db,
+            node_name,
+            input_hash,
+            result,
+            scene_id=scene_id,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+    return result
+
+
 _BLANK_PNG_BYTES = (
     b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
     b"\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\xf8\xff\xff"
     b"?\x03\x00\x08\xfc\x02\xfe\xd2\xf3j\xf5\x00\x00\x00\x00IEND\xaeB`\x82"
 )
-def _list_characters(db: Session, story_id: uuid.UUID) -> list[Character]:
-    stmt = (
-        select(Character)
-        .join(StoryCharacter, StoryCharacter.character_id == Character.character_id)
-        .where(StoryCharacter.story_id == story_id)
-    )
-    return list(db.execute(stmt).scalars().all())
 
 
 def _group_chunks(items: list[str], max_groups: int) -> list[str]:
@@ -130,15 +175,43 @@ def _group_chunks(items: list[str], max_groups: int) -> list[str]:
     return chunks[:max_groups]
 
 
+_TOKEN4_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+_WORD_COUNT_RE = re.compile(r"\w+")
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_MONTAGE_CUE_RE = re.compile(
+    r"\b(montage|sequence|series of|step by step|one after another|rapid|quickly|rapidly|in rapid succession|cut to|meanwhile)\b"
+)
+_ACTION_VERB_RE = re.compile(r"\b(runs?|chases?|fights?|strikes?|dodges?|leaps?|rushes?)\b")
+# Escaped-literal alternation over the QC narration phrases: one scan per
+# dialogue line instead of a substring probe per phrase.
+_QC_NARRATION_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            " he says",
+            " she says",
+            " he whispers",
+            " she whispers",
+            " he thinks",
+            " she thinks",
+            " as you know",
+            " meanwhile",
+            " suddenly",
+        )
+    )
+)
+
+
 def _extract_must_show(text: str) -> list[str]:
-    tokens = re.findall(r"\b[a-zA-Z]{4,}\b", text)
-    common = []
-    for token in tokens:
-        key = token.lower()
-        if key not in common:
+    common: list[str] = []
+    seen: set[str] = set()
+    for token in _TOKEN4_RE.finditer(text):
+        key = token.group().lower()
+        if key not in seen:
+            seen.add(key)
             common.append(key)
-        if len(common) >= 4:
-            break
+            if len(common) >= 4:
+                break
     return common
 
 
@@ -152,7 +225,7 @@ def _panel_count_for_importance(
     Returns a value between 1-5 (hard limit for panel count per scene).
     """
     importance = (scene_importance or "").lower()
-    word_count = len(re.findall(r"\w+", scene_text or ""))
+    word_count = len(_WORD_COUNT_RE.findall(scene_text or ""))
 
     # Default range 1-3. Allow 4-5 only for special fast/montage cases.
     MAX_PANELS = 5
@@ -160,14 +233,11 @@ def _panel_count_for_importance(
 
     def _needs_many_panels(text: str) -> bool:
         text_lower = (text or "").lower()
-        if len(re.findall(r"[.!?]+", text_lower)) >= 7:
+        if len(_SENTENCE_END_RE.findall(text_lower)) >= 7:
             return True
-        if re.search(
-            r"\b(montage|sequence|series of|step by step|one after another|rapid|quickly|rapidly|in rapid succession|cut to|meanwhile)\b",
-            text_lower,
-        ):
+        if _MONTAGE_CUE_RE.search(text_lower):
             return True
-        if re.search(r"\b(runs?|chases?|fights?|strikes?|dodges?|leaps?|rushes?)\b", text_lower):
+        if _ACTION_VERB_RE.search(text_lower):
             return True
         return False
 
@@ -316,17 +386,26 @@ def _heuristic_panel_semantics(
     dialogue_iter = iter(dialogue_lines)
     names = [c.name for c in characters]
     setting_hint = _extract_setting(scene_text) or "room"
-    environment_keywords = loaders.load_qc_rules_v1().environment_keywords
+    env_keywords_re = _env_keywords_re()
+    summary = scene_intent.get("summary") if scene_intent else None
+
+    # The establishing description is the same for every establishing panel,
+    # so resolve the keyword check and setting suffix once instead of
+    # re-lowering the string per panel.
+    establishing_desc = grammar_lib.get("establishing", "Panel")
+    if summary:
+        establishing_desc = f"{establishing_desc} {summary}"
+    if env_keywords_re is None or not env_keywords_re.search(establishing_desc.lower()):
+        establishing_desc = f"{establishing_desc} {setting_hint}"
 
     for panel in panel_plan.get("panels", []):
         grammar_id = panel.get("grammar_id")
-        description = grammar_lib.get(grammar_id, "Panel")
-        if scene_intent and scene_intent.get("summary"):
-            description = f"{description} {scene_intent['summary']}"
         if grammar_id == "establishing":
-            lowered = description.lower()
-            if not any(word in lowered for word in environment_keywords):
-                description = f"{description} {setting_hint}"
+            description = establishing_desc
+        else:
+            description = grammar_lib.get(grammar_id, "Panel")
+            if summary:
+                description = f"{description} {summary}"
 
         dialogue: list[str] = []
         if grammar_id in {"dialogue_medium", "emotion_closeup"}:
@@ -396,21 +475,7 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
         return out
 
     def _is_narration_like(text: str) -> bool:
-        lowered = text.lower()
-        return any(
-            phrase in lowered
-            for phrase in (
-                " he says",
-                " she says",
-                " he whispers",
-                " she whispers",
-                " he thinks",
-                " she thinks",
-                " as you know",
-                " meanwhile",
-                " suddenly",
-            )
-        )
+        return _QC_NARRATION_RE.search(text.lower()) is not None
 
     def _is_generic_dialogue(text: str) -> bool:
         lowered = text.lower()
@@ -436,6 +501,8 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
     generic_lines = 0
     semantics_panels = list(panel_semantics.get("panels") or []) if panel_semantics else []
 
+    redundant_panels: list[int] = []
+
     for p_sem in semantics_panels:
         lines = _line_texts(p_sem.get("dialogue"))
         panel_words = sum(len(line.split()) for line in lines)
@@ -460,6 +527,12 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
             if _is_generic_dialogue(line):
                 generic_lines += 1
 
+        # Show-Don't-Tell / Dialogue Redundancy (fused into the same pass)
+        dialogue_joined = " ".join(lines).lower()
+        if any(key in dialogue_joined for key in ("i am showing", "look at", "see how i", "as you can see")):
+            if isinstance(panel_id, int):
+                redundant_panels.append(panel_id)
+
     if word_count_violations:
         issues.append("word_count_violation")
         issue_details.append(
@@ -481,16 +554,30 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
         )
 
     # 2. Layout Monotony check (Task 7.1)
-    widths = [p.get("panel_hierarchy", {}).get("width_percentage") for p in panels]
+    # Slot-backed records: grammar_id/width reads below hit fixed offsets
+    # instead of nested dict lookups per panel.
+    # The closeup count shares this walk. The issue decision uses an integer
+    # cap (count > ratio*total ⇔ count >= floor(ratio*total)+1), but the
+    # count keeps accumulating past it so the persisted metrics report the
+    # true closeup_count/closeup_ratio.
+    panel_records = _to_panel_records(panels)
+    closeup_cap = math.floor(rules.closeup_ratio_max * total) + 1
+    closeup_count = 0
     monotony_run = 1
     max_monotony = 1
-    for idx in range(1, len(widths)):
-        if widths[idx] == widths[idx-1] and widths[idx] is not None:
+    prev_width: object = None
+    for idx, rec in enumerate(panel_records):
+        if rec.grammar_id == "emotion_closeup":
+            closeup_count += 1
+        width = rec.width_percentage
+        if idx and width == prev_width and width is not None:
             monotony_run += 1
-            max_monotony = max(max_monotony, monotony_run)
+            if monotony_run > max_monotony:
+                max_monotony = monotony_run
         else:
             monotony_run = 1
-    
+        prev_width = width
+
     if max_monotony >= rules.repeated_framing_run_length:
         issues.append("monotonous_layout")
         issue_details.append({
@@ -499,15 +586,6 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
             "hint": "Vary panel widths (100%, 80%, 60%) to improve rhythm."
         })
 
-    # 3. Show-Don't-Tell / Dialogue Redundancy
-    redundant_panels: list[int] = []
-    for p_sem in semantics_panels:
-        panel_id = p_sem.get("panel_index")
-        dialogue_joined = " ".join(_line_texts(p_sem.get("dialogue"))).lower()
-        if any(key in dialogue_joined for key in ["i am showing", "look at", "see how i", "as you can see"]):
-            if isinstance(panel_id, int):
-                redundant_panels.append(panel_id)
-
     if redundant_panels:
         issues.append("dialogue_redundancy")
         issue_details.append({
@@ -516,12 +594,9 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
             "hint": "Let the art show the action; remove self-descriptive dialogue."
         })
 
-    # Existing closeup and dialogue ratio checks
-    closeups = [p for p in panels if p.get("grammar_id") == "emotion_closeup"]
-    closeup_count = len(closeups)
     closeup_ratio = closeup_count / total
 
-    if closeup_ratio > rules.closeup_ratio_max:
+    if closeup_count >= closeup_cap:
         issues.append("too_many_closeups")
         issue_details.append(
             {
@@ -531,13 +606,14 @@ def _qc_report(panel_plan: dict, panel_semantics: dict | None) -> dict:
             }
         )
 
+    dialogue_cap = math.floor(rules.dialogue_ratio_max * total) + 1
     dialogue_count = dialogue_panels
     dialogue_ratio = dialogue_count / total if total > 0 else 0.0
     silent_ratio = (silent_panels / total) if total > 0 else 0.0
     narration_ratio = (narration_like_lines / total_dialogue_lines) if total_dialogue_lines else 0.0
     generic_ratio = (generic_lines / total_dialogue_lines) if total_dialogue_lines else 0.0
 
-    if dialogue_ratio > rules.dialogue_ratio_max:
+    if dialogue_count >= dialogue_cap:
         issues.append("too_much_dialogue")
         allowed = max(1, int(total * rules.dialogue_ratio_max))
         issue_details.append({
@@ -607,9 +683,12 @@ def roundup(val, digits):
 
 
 def _character_ids_with_reference_images(db: Session, story_id: uuid.UUID) -> set[uuid.UUID]:
-    variant_mapping = _active_variant_reference_images(db, story_id)
-    variant_char_ids = {cid for (cid, vtype) in variant_mapping.keys()}
-    stmt = (
+    """Character ids with a usable reference image, in one round-trip.
+
+    UNION of approved face refs and active variants whose reference image
+    resolves, previously issued as separate queries.
+    """
+    face_stmt = (
         select(CharacterReferenceImage.character_id)
         .join(StoryCharacter, CharacterReferenceImage.character_id == StoryCharacter.character_id)
         .where(
@@ -617,9 +696,19 @@ def _character_ids_with_reference_images(db: Session, story_id: uuid.UUID) -> se
             CharacterReferenceImage.approved.is_(True),
             CharacterReferenceImage.ref_type == "face",
         )
-        .distinct()
     )
-    return set(db.execute(stmt).scalars().all()).union(variant_char_ids)
+    variant_stmt = (
+        select(CharacterVariant.character_id)
+        .join(
+            CharacterReferenceImage,
+            CharacterReferenceImage.reference_image_id == CharacterVariant.reference_image_id,
+        )
+        .where(
+            CharacterVariant.story_id == story_id,
+            CharacterVariant.is_active_for_story.is_(True),
+        )
+    )
+    return set(db.execute(face_stmt.union(variant_stmt)).scalars().all())
 
 
 def _render_image_from_prompt(
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import uuid
+from collections.abc import Sequence
 from functools import partial
 from typing import Any, TypedDict
 
@@ -14,6 +16,7 @@ from app.db.models import Scene, Story
 from app.db.session import session_scope
 from app.core.metrics import track_graph_node
 from app.core.request_context import log_context
+from app.core.settings import settings
 from app.core.telemetry import trace_span
 from app.services.artifacts import ArtifactService
 from app.services.vertex_gemini import GeminiClient
@@ -85,6 +88,21 @@ def _node_llm_panel_plan(state: PlanningState, gemini: GeminiClient | None) -> d
     return {"panel_plan_artifact_id": str(artifact.artifact_id)}
 
 
+def _node_llm_combined_plan(state: PlanningState, gemini: GeminiClient | None) -> dict[str, Any]:
+    with session_scope() as db:
+        intent, plan, semantics = nodes.run_combined_scene_planner(
+            db=db,
+            scene_id=state["scene_id"],
+            panel_count=int(state.get("panel_count") or 3),
+            gemini=gemini,
+        )
+    return {
+        "scene_intent_artifact_id": str(intent.artifact_id),
+        "panel_plan_artifact_id": str(plan.artifact_id),
+        "panel_semantics_artifact_id": str(semantics.artifact_id),
+    }
+
+
 def _node_rule_panel_plan_normalize(state: PlanningState) -> dict[str, Any]:
     with session_scope() as db:
         artifact = nodes.run_panel_plan_normalizer(db=db, scene_id=state["scene_id"])
@@ -166,6 +184,20 @@ def _node_render(state: RenderState, gemini: GeminiClient | None) -> dict[str, A
 def build_scene_planning_graph(gemini: GeminiClient | None = None):
     graph = StateGraph(PlanningState)
 
+    if settings.combined_pipeline_enabled:
+        # One Gemini round-trip produces intent + plan + semantics; only the
+        # rule-based post-processing stays as separate nodes.
+        graph.add_node("llm_combined_plan", partial(_node_llm_combined_plan, gemini=gemini))
+        graph.add_node("rule_panel_plan_normalize", _node_rule_panel_plan_normalize)
+        graph.add_node("rule_layout", _node_rule_layout)
+
+        graph.set_entry_point("llm_combined_plan")
+        graph.add_edge("llm_combined_plan", "rule_panel_plan_normalize")
+        graph.add_edge("rule_panel_plan_normalize", "rule_layout")
+        graph.add_edge("rule_layout", END)
+
+        return graph.compile()
+
     # LLM nodes
     graph.add_node("llm_scene_intent", partial(_node_llm_scene_intent, gemini=gemini))
     graph.add_node("llm_panel_plan", partial(_node_llm_panel_plan, gemini=gemini))
@@ -345,3 +377,117 @@ def run_full_pipeline(
                     (time.perf_counter() - pipeline_started) * 1000,
                 )
                 return out
+
+
+async def run_pipeline_async(
+    scene_ids: Sequence[uuid.UUID],
+    panel_count: int = 3,
+    style_id: str | None = None,
+    genre: str | None = None,
+    prompt_override: str | None = None,
+    gemini: GeminiClient | None = None,
+    max_concurrency: int = 4,
+) -> list[PipelineState]:
+    """Run the full pipeline for several scenes concurrently.
+
+    Each scene still executes its stages in dependency order, but scenes fan
+    out onto worker threads (the pipeline is dominated by Gemini round-trips,
+    so overlapping scenes collapses batch latency from the serial sum of all
+    stages toward the slowest single scene). ``max_concurrency`` bounds the
+    fan-out so we stay inside the Gemini concurrency limit.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _run_one(scene_id: uuid.UUID) -> PipelineState:
+        with session_scope() as db:
+            return run_full_pipeline(
+                db=db,
+                scene_id=scene_id,
+                panel_count=panel_count,
+                style_id=style_id,
+                genre=genre,
+                prompt_override=prompt_override,
+                gemini=gemini,
+            )
+
+    async def _bounded(scene_id: uuid.UUID) -> PipelineState:
+        async with semaphore:
+            return await asyncio.to_thread(_run_one, scene_id)
+
+    return list(await asyncio.gather(*(_bounded(scene_id) for scene_id in scene_ids)))
+
+
+async def run_scene_intent_batch_async(
+    scene_ids: Sequence[uuid.UUID],
+    gemini: GeminiClient | None = None,
+    max_concurrency: int = 8,
+) -> list[str]:
+    """Extract scene intent for several scenes concurrently.
+
+    Scene intent extraction is a single independent Gemini call per scene,
+    so fanning scenes out collapses an N-scene batch from N round-trips in
+    sequence to roughly one. Each scene gets its own session; returns the
+    created artifact ids in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _run_one(scene_id: uuid.UUID) -> str:
+        with session_scope() as db:
+            artifact = nodes.run_scene_intent_extractor(db, scene_id, gemini=gemini)
+            return str(artifact.artifact_id)
+
+    async def _bounded(scene_id: uuid.UUID) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(_run_one, scene_id)
+
+    return list(await asyncio.gather(*(_bounded(scene_id) for scene_id in scene_ids)))
+
+
+def run_scene_intent_batch(
+    scene_ids: Sequence[uuid.UUID],
+    gemini: GeminiClient | None = None,
+    max_concurrency: int = 8,
+) -> list[str]:
+    """Sync wrapper around :func:`run_scene_intent_batch_async`."""
+    return asyncio.run(
+        run_scene_intent_batch_async(scene_ids, gemini=gemini, max_concurrency=max_concurrency)
+    )
+
+
+async def run_blind_test_batch_async(
+    scene_ids: Sequence[uuid.UUID],
+    gemini: GeminiClient | None = None,
+    max_concurrency: int = 8,
+) -> list[str]:
+    """Run the blind-test evaluator for several scenes concurrently.
+
+    Within one scene the reader and comparator calls are sequential (the
+    comparator consumes the reader's output), but scenes are independent of
+    each other, so fanning them out keeps Gemini's concurrent-request budget
+    busy instead of paying two round-trips per scene in series. Each scene
+    gets its own session; returns the created report artifact ids in input
+    order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _run_one(scene_id: uuid.UUID) -> str:
+        with session_scope() as db:
+            artifact = nodes.run_blind_test_evaluator(db, scene_id, gemini=gemini)
+            return str(artifact.artifact_id)
+
+    async def _bounded(scene_id: uuid.UUID) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(_run_one, scene_id)
+
+    return list(await asyncio.gather(*(_bounded(scene_id) for scene_id in scene_ids)))
+
+
+def run_blind_test_batch(
+    scene_ids: Sequence[uuid.UUID],
+    gemini: GeminiClient | None = None,
+    max_concurrency: int = 8,
+) -> list[str]:
+    """Sync wrapper around :func:`run_blind_test_batch_async`."""
+    return asyncio.run(
+        run_blind_test_batch_async(scene_ids, gemini=gemini, max_concurrency=max_concurrency)
+    )
@@ -14,6 +14,42 @@ class ArtifactService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _next_artifact(
+        self,
+        scene_id: uuid.UUID,
+        type: str,
+        payload: dict,
+        parent_id: uuid.UUID | None,
+    ) -> Artifact:
+        """Build the next-version Artifact row for ``(scene_id, type)``."""
+        latest = self.db.execute(
+            select(Artifact)
+            .where(Artifact.scene_id == scene_id, Artifact.type == type)
+            .order_by(desc(Artifact.version))
+            .limit(1)
+        ).scalar_one_or_none()
+
+        next_version = 1
+        next_parent_id = parent_id
+        if latest is not None:
+            next_version = latest.version + 1
+            if next_parent_id is None:
+                next_parent_id = latest.artifact_id
+
+        request_id = get_request_id()
+        payload_with_request = dict(payload)
+        if request_id:
+            payload_with_request.setdefault("request_id", request_id)
+        return Artifact(
+            scene_id=scene_id,
+            type=type,
+            version=next_version,
+            parent_id=next_parent_id,
+            payload=payload_with_request,
+            created_by=request_id,
+            updated_by=request_id,
+        )
+
     def create_artifact(
         self,
         scene_id: uuid.UUID,
@@ -22,33 +58,7 @@ class ArtifactService:
         parent_id: uuid.UUID | None = None,
     ) -> Artifact:
         for _ in range(3):
-            latest = self.db.execute(
-                select(Artifact)
-                .where(Artifact.scene_id == scene_id, Artifact.type == type)
-                .order_by(desc(Artifact.version))
-                .limit(1)
-            ).scalar_one_or_none()
-
-            next_version = 1
-            next_parent_id = parent_id
-            if latest is not None:
-                next_version = latest.version + 1
-                if next_parent_id is None:
-                    next_parent_id = latest.artifact_id
-
-            request_id = get_request_id()
-            payload_with_request = dict(payload)
-            if request_id:
-                payload_with_request.setdefault("request_id", request_id)
-            artifact = Artifact(
-                scene_id=scene_id,
-                type=type,
-                version=next_version,
-                parent_id=next_parent_id,
-                payload=payload_with_request,
-                created_by=request_id,
-                updated_by=request_id,
-            )
+            artifact = self._next_artifact(scene_id, type, payload, parent_id)
             self.db.add(artifact)
             try:
                 self.db.commit()
@@ -56,6 +66,7 @@ class ArtifactService:
                 self.db.rollback()
                 continue
             self.db.refresh(artifact)
+            self._latest_cache()[(scene_id, type)] = artifact
             log_audit_entry(
                 self.db,
                 entity_type="artifact",
@@ -76,6 +87,41 @@ class ArtifactService:
             orig=None,
         )
 
+    def create_artifact_deferred(
+        self,
+        scene_id: uuid.UUID,
+        type: str,
+        payload: dict,
+        parent_id: uuid.UUID | None = None,
+    ) -> Artifact:
+        """Create an artifact without committing; the caller owns the transaction.
+
+        Nodes that persist several artifacts in one run (e.g. the combined
+        scene planner) call this per artifact and commit once at the end,
+        collapsing one fsync per artifact-plus-audit-row into a single
+        commit. The row is flushed so its id and version are assigned;
+        version conflicts surface at the caller's commit instead of being
+        retried here.
+        """
+        artifact = self._next_artifact(scene_id, type, payload, parent_id)
+        self.db.add(artifact)
+        self.db.flush()
+        self._latest_cache()[(scene_id, type)] = artifact
+        log_audit_entry(
+            self.db,
+            entity_type="artifact",
+            entity_id=artifact.artifact_id,
+            action="created",
+            new_value={
+                "scene_id": str(scene_id),
+                "type": type,
+                "version": artifact.version,
+            },
+            defer_commit=True,
+        )
+        record_artifact_creation(type)
+        return artifact
+
     def list_artifacts(self, scene_id: uuid.UUID, type: str | None = None) -> list[Artifact]:
         stmt = select(Artifact).where(Artifact.scene_id == scene_id)
         if type is not None:
@@ -86,14 +132,64 @@ class ArtifactService:
     def get_artifact(self, artifact_id: uuid.UUID) -> Artifact | None:
         return self.db.get(Artifact, artifact_id)
 
+    def _latest_cache(self) -> dict:
+        """Session-scoped memo of latest artifacts keyed by (scene_id, type).
+
+        Nodes in one pipeline re-read the same latest rows several times;
+        caching in ``Session.info`` limits each (scene, type) pair to one
+        SELECT per session. ``create_artifact`` refreshes the key it writes.
+        """
+        return self.db.info.setdefault("_latest_artifacts", {})
+
     def get_latest_artifact(self, scene_id: uuid.UUID, type: str) -> Artifact | None:
+        cache = self._latest_cache()
+        key = (scene_id, type)
+        if key in cache:
+            return cache[key]
         stmt = (
             select(Artifact)
             .where(Artifact.scene_id == scene_id, Artifact.type == type)
             .order_by(desc(Artifact.version))
             .limit(1)
         )
-        return self.db.execute(stmt).scalar_one_or_none()
+        artifact = self.db.execute(stmt).scalar_one_or_none()
+        cache[key] = artifact
+        return artifact
+
+    def get_latest_artifacts_by_types(
+        self, scene_id: uuid.UUID, types: list[str]
+    ) -> dict[str, Artifact]:
+        """Fetch the latest artifact of each requested type in one query.
+
+        Uses row_number() partitioned by type so call sites needing several
+        artifact types pay a single round-trip instead of one per type.
+        """
+        cache = self._latest_cache()
+        found = {
+            type_: cache[(scene_id, type_)]
+            for type_ in types
+            if (scene_id, type_) in cache and cache[(scene_id, type_)] is not None
+        }
+        missing = [type_ for type_ in types if (scene_id, type_) not in cache]
+        if missing:
+            rn = (
+                func.row_number()
+                .over(partition_by=Artifact.type, order_by=desc(Artifact.version))
+                .label("rn")
+            )
+            subq = (
+                select(Artifact.artifact_id, rn)
+                .where(Artifact.scene_id == scene_id, Artifact.type.in_(missing))
+                .subquery()
+            )
+            stmt = select(Artifact).join(
+                subq, (Artifact.artifact_id == subq.c.artifact_id) & (subq.c.rn == 1)
+            )
+            fetched = {artifact.type: artifact for artifact in self.db.execute(stmt).scalars()}
+            for type_ in missing:
+                cache[(scene_id, type_)] = fetched.get(type_)
+            found.update(fetched)
+        return found
 
     def get_next_version(self, scene_id: uuid.UUID, type: str) -> int:
         stmt = select(func.max(Artifact.version)).where(Artifact.scene_id == scene_id, Artifact.type == type)
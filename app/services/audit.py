@@ -18,6 +18,7 @@ def log_audit_entry(
     action: str,
     old_value: dict[str, Any] | None = None,
     new_value: dict[str, Any] | None = None,
+    defer_commit: bool = False,
 ) -> AuditLog:
     entry = AuditLog(
         entity_type=entity_type,
@@ -28,6 +29,10 @@ def log_audit_entry(
         new_value=new_value,
     )
     db.add(entry)
+    if defer_commit:
+        # Caller owns the transaction and commits the entry with its own
+        # writes; the entry is flushed together with them.
+        return entry
     db.commit()
     db.refresh(entry)
     return entry
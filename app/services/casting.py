@@ -19,7 +19,7 @@ from app.core.gemini_factory import build_gemini_client
 from app.core.settings import settings
 from app.db.models import Character, CharacterReferenceImage, CharacterVariant, Image
 from app.prompts.loader import render_prompt
-from app.services.storage import LocalMediaStore
+from app.services.storage import default_media_store
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -29,10 +29,7 @@ logger = logging.getLogger(__name__)
 
 def _save_image(image_bytes: bytes, mime_type: str) -> str:
     """Save image bytes and return URL."""
-    store = LocalMediaStore(
-        root_dir=settings.media_root,
-        url_prefix=settings.media_url_prefix,
-    )
+    store = default_media_store()
     _, url = store.save_image_bytes(image_bytes=image_bytes, mime_type=mime_type)
     return url
 
@@ -0,0 +1,90 @@
+"""Content-addressed cache for deterministic LLM node outputs.
+
+Planning nodes such as scene_intent and panel_plan are deterministic in
+their rendered prompt, so retries, re-runs, and A/B evaluations of the
+same scene can reuse the parsed payload instead of paying another Gemini
+round-trip. Entries live in the ``llm_cache`` table keyed by
+``(node_name, input_hash)`` with an optional expiry.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.hashing import prompt_cache_key
+from app.db.models import LLMCacheEntry
+
+
+def llm_input_hash(prompt: str, model: str | None = None) -> str:
+    """Hash the rendered prompt (and model, when set) into a cache key."""
+    return prompt_cache_key(prompt, model)
+
+
+def get_cached_payload(db: Session, node_name: str, input_hash: str) -> dict[str, Any] | None:
+    """Return the cached payload for ``(node_name, input_hash)``, or None.
+
+    Expired entries are treated as misses; they are overwritten on the
+    next store rather than vacuumed eagerly.
+    """
+    entry = db.execute(
+        select(LLMCacheEntry).where(
+            LLMCacheEntry.node_name == node_name,
+            LLMCacheEntry.input_hash == input_hash,
+        )
+    ).scalar_one_or_none()
+    if entry is None:
+        return None
+    if entry.expires_at is not None:
+        expires_at = entry.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at <= datetime.now(timezone.utc):
+            return None
+    return entry.payload
+
+
+def store_payload(
+    db: Session,
+    node_name: str,
+    input_hash: str,
+    payload: dict[str, Any],
+    scene_id: uuid.UUID | None = None,
+    ttl_seconds: int | None = None,
+) -> None:
+    """Upsert a node payload under ``(node_name, input_hash)``."""
+    expires_at = None
+    if ttl_seconds is not None and ttl_seconds > 0:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+
+    existing = db.execute(
+        select(LLMCacheEntry).where(
+            LLMCacheEntry.node_name == node_name,
+            LLMCacheEntry.input_hash == input_hash,
+        )
+    ).scalar_one_or_none()
+    if existing is not None:
+        existing.payload = payload
+        existing.scene_id = scene_id
+        existing.expires_at = expires_at
+        db.commit()
+        return
+
+    entry = LLMCacheEntry(
+        scene_id=scene_id,
+        node_name=node_name,
+        input_hash=input_hash,
+        payload=payload,
+        expires_at=expires_at,
+    )
+    db.add(entry)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent run stored the same key; its payload is equivalent.
+        db.rollback()
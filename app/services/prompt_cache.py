@@ -0,0 +1,56 @@
+"""In-process cache for Gemini text generations keyed by prompt content.
+
+Retry and regeneration workflows frequently resend byte-identical prompts
+(same scene text, same intent, same panel count). Caching on the SHA-256 of
+the prompt turns those repeat calls into a dict lookup instead of a network
+round-trip.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+
+from app.core.hashing import prompt_cache_key
+from app.services.vertex_gemini import GeminiClient
+
+logger = logging.getLogger(__name__)
+
+
+class CachedGeminiClient:
+    """Wraps a GeminiClient with a bounded LRU cache over generate_text.
+
+    Only exact prompt matches hit; image generation and any other client
+    attributes delegate straight to the wrapped client, so the wrapper can be
+    used anywhere a GeminiClient is expected.
+    """
+
+    def __init__(self, client: GeminiClient, max_entries: int = 256):
+        self._client = client
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+    def generate_text(
+        self,
+        prompt: str,
+        model: str | None = None,
+        use_fallback: bool = False,
+    ) -> str:
+        key = prompt_cache_key(prompt, model)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.debug("prompt_cache hit (prompt_len=%s)", len(prompt))
+            return cached
+
+        result = self._client.generate_text(prompt=prompt, model=model, use_fallback=use_fallback)
+        self._cache[key] = result
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
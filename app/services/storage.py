@@ -1,5 +1,8 @@
 import os
 import uuid
+from functools import lru_cache
+
+from app.core.settings import settings
 
 
 def _ext_from_mime(mime_type: str) -> str:
@@ -31,3 +34,15 @@ class LocalMediaStore:
 
         url = f"{self.url_prefix}/{filename}"
         return file_path, url
+
+
+@lru_cache(maxsize=1)
+def default_media_store() -> LocalMediaStore:
+    """Process-wide store for the settings-configured media root.
+
+    Render and casting paths used to build a fresh LocalMediaStore per
+    image; the store is stateless beyond its two settings-derived paths, so
+    one shared instance serves every caller. Tests that mutate media
+    settings can call ``default_media_store.cache_clear()``.
+    """
+    return LocalMediaStore(root_dir=settings.media_root, url_prefix=settings.media_url_prefix)
@@ -0,0 +1,49 @@
+"""Bundled per-story context for render-path nodes.
+
+run_prompt_compiler (and friends) need the story row, its cast, which
+characters carry approved face references, and the active variants — each
+previously fetched by a separate helper call. Loading them together keeps
+a scene render at two SQL statements and gives callers one object to pass
+around instead of re-querying per node.
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Character, CharacterVariant, Story
+from app.graphs.nodes.helpers.character import _active_variants_by_character
+from app.graphs.nodes.helpers.scene import _load_characters_with_face_refs
+
+
+@dataclass(slots=True)
+class StoryContext:
+    story: Story | None
+    characters: list[Character]
+    reference_char_ids: set[uuid.UUID]
+    variants_by_character: dict[uuid.UUID | tuple[uuid.UUID, str], CharacterVariant]
+
+
+def load_story_context(db: Session, story_id: uuid.UUID) -> StoryContext:
+    """Load story, characters, face-ref ids, and active variants at once.
+
+    Characters whose active variant carries a reference image also count as
+    having a reference, matching the union the render path has always used.
+    """
+    story = db.get(Story, story_id)
+    characters, reference_char_ids = _load_characters_with_face_refs(db, story_id)
+    variants_by_character = _active_variants_by_character(db, story_id)
+    reference_char_ids = reference_char_ids | {
+        variant.character_id
+        for variant in variants_by_character.values()
+        if variant.reference_image_id is not None
+    }
+    return StoryContext(
+        story=story,
+        characters=characters,
+        reference_char_ids=reference_char_ids,
+        variants_by_character=variants_by_character,
+    )
@@ -1,4 +1,5 @@
 
+import asyncio
 import time
 import uuid
 import logging
@@ -488,6 +489,22 @@ class GeminiClient:
                 return self._extract_text_from_response(response)
             raise
 
+    async def agenerate_text(
+        self,
+        prompt: str,
+        model: str | None = None,
+        use_fallback: bool = False,
+    ) -> str:
+        """Async counterpart of :meth:`generate_text`.
+
+        Runs the sync call on a worker thread so independent requests overlap
+        their network latency under ``asyncio.gather`` while sharing the same
+        retry, fallback, and circuit-breaker logic as the sync path.
+        """
+        return await asyncio.to_thread(
+            self.generate_text, prompt, model=model, use_fallback=use_fallback
+        )
+
     def generate_image(
         self,
         prompt: str,
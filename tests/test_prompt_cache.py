@@ -0,0 +1,73 @@
+"""Tests for the prompt-hash Gemini response cache."""
+
+from app.services.prompt_cache import CachedGeminiClient
+
+
+class CountingGemini:
+    def __init__(self):
+        self.calls = 0
+        self.last_model = "fake-model"
+
+    def generate_text(self, prompt: str, model=None, use_fallback=False) -> str:
+        self.calls += 1
+        return f"response-{self.calls}"
+
+
+def test_identical_prompt_hits_cache():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner)
+
+    first = client.generate_text("same prompt")
+    second = client.generate_text("same prompt")
+
+    assert first == second == "response-1"
+    assert inner.calls == 1
+
+
+def test_different_prompts_miss():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner)
+
+    client.generate_text("prompt a")
+    client.generate_text("prompt b")
+
+    assert inner.calls == 2
+
+
+def test_model_is_part_of_the_key():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner)
+
+    client.generate_text("same prompt", model="model-a")
+    client.generate_text("same prompt", model="model-b")
+
+    assert inner.calls == 2
+
+
+def test_eviction_respects_max_entries():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner, max_entries=1)
+
+    client.generate_text("prompt a")
+    client.generate_text("prompt b")  # evicts "prompt a"
+    client.generate_text("prompt a")
+
+    assert inner.calls == 3
+
+
+def test_clear_empties_cache():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner)
+
+    client.generate_text("same prompt")
+    client.clear()
+    client.generate_text("same prompt")
+
+    assert inner.calls == 2
+
+
+def test_attribute_delegation():
+    inner = CountingGemini()
+    client = CachedGeminiClient(inner)
+
+    assert client.last_model == "fake-model"